@@ -6,27 +6,32 @@ import sys
 import os
 from pathlib import Path
 
+# Import once at module level; the import test below reports any failure
+try:
+    import duckdb
+    DUCKDB_IMPORT_ERROR = None
+except Exception as e:
+    duckdb = None
+    DUCKDB_IMPORT_ERROR = e
+
 def test_basic_duckdb():
     """Test basic DuckDB functionality"""
     print("Testing basic DuckDB import...", file=sys.stderr)
-    try:
-        import duckdb
-        print("✓ DuckDB import successful", file=sys.stderr)
-        return True
-    except Exception as e:
-        print(f"✗ DuckDB import failed: {e}", file=sys.stderr)
+    if duckdb is None:
+        print(f"✗ DuckDB import failed: {DUCKDB_IMPORT_ERROR}", file=sys.stderr)
         return False
+    print("✓ DuckDB import successful", file=sys.stderr)
+    return True
 
-def test_memory_connection():
+def test_memory_connection(conn):
     """Test in-memory DuckDB connection"""
     print("Testing in-memory DuckDB connection...", file=sys.stderr)
     try:
-        import duckdb
-        conn = duckdb.connect(":memory:")
-        conn.execute("CREATE TABLE test (id INTEGER, name VARCHAR)")
+        if conn is None:
+            raise RuntimeError(f"DuckDB not available: {DUCKDB_IMPORT_ERROR}")
+        conn.execute("CREATE OR REPLACE TABLE test (id INTEGER, name VARCHAR)")
         conn.execute("INSERT INTO test VALUES (1, 'test')")
         result = conn.execute("SELECT * FROM test").fetchall()
-        conn.close()
         print(f"✓ In-memory connection successful: {result}", file=sys.stderr)
         return True
     except Exception as e:
@@ -64,8 +69,8 @@ def test_file_connection():
         
     print(f"Testing file connection to: {db_path}", file=sys.stderr)
     try:
-        import duckdb
-        conn = duckdb.connect(str(db_path))
+        # Read-only avoids taking the write lock on a file another process may hold
+        conn = duckdb.connect(str(db_path), read_only=True)
         tables = conn.execute("SHOW TABLES").fetchall()
         conn.close()
         print(f"✓ File connection successful, tables: {tables}", file=sys.stderr)
@@ -79,17 +84,24 @@ def test_file_connection():
 if __name__ == "__main__":
     print("=== DuckDB Connection Debug ===", file=sys.stderr)
     
+    # One in-memory connection shared by the in-memory tests
+    memory_conn = duckdb.connect(":memory:") if duckdb is not None else None
+    
     tests = [
         ("Basic DuckDB Import", test_basic_duckdb),
-        ("In-Memory Connection", test_memory_connection),
+        ("In-Memory Connection", lambda: test_memory_connection(memory_conn)),
         ("File Existence Check", test_file_exists),
         ("File Connection", test_file_connection),
     ]
     
     passed = 0
-    for name, test_func in tests:
-        print(f"\n--- {name} ---", file=sys.stderr)
-        if test_func():
-            passed += 1
+    try:
+        for name, test_func in tests:
+            print(f"\n--- {name} ---", file=sys.stderr)
+            if test_func():
+                passed += 1
+    finally:
+        if memory_conn is not None:
+            memory_conn.close()
     
     print(f"\n=== Results: {passed}/{len(tests)} tests passed ===", file=sys.stderr)
\ No newline at end of file
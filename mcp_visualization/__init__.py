@@ -8,13 +8,23 @@ __version__ = "0.0.3"
 __author__ = "MCP Visualization Contributors"
 __email__ = "support@example.com"
 
-try:
-    from .claude_config import configure_claude_desktop
-    from .database import create_sample_database
-    from .server import test_server_import
-except ImportError:
-    # Handle case where dependencies aren't installed yet
-    pass
+# Public helpers are imported on first access (PEP 562) so that importing the
+# package, e.g. for the CLI or the config manager, does not load DuckDB or MCP
+_LAZY_ATTRIBUTES = {
+    "configure_claude_desktop": ".claude_config",
+    "create_sample_database": ".database",
+    "test_server_import": ".server",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "configure_claude_desktop", 
@@ -0,0 +1,8 @@
+"""
+Allow `python -m mcp_visualization` as an alias for the mcp-viz command
+"""
+
+from .cli_entry import main
+
+if __name__ == "__main__":
+    main()
@@ -3,62 +3,185 @@ Claude Desktop configuration manager for automatic MCP server setup
 """
 
 import json
+import os
 import platform
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import ClassVar, Dict, Any, FrozenSet, Optional, Set, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup - fall back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Reused stdlib encoder for config writes when orjson is unavailable
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _loads_config(data: bytes) -> Dict[str, Any]:
+    """Parse raw config bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_config(config: Dict[str, Any]) -> bytes:
+    """Serialize config to indented UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (_JSON_ENCODER.encode(config) + '\n').encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _resolve_config_path(relative_path: str) -> Path:
+    """Resolve a platform config path under the user's home directory once"""
+    return Path.home() / relative_path
+
+
+if sys.platform == "win32":
+    _fast_exists = os.path.exists
+else:
+    def _fast_exists(path) -> bool:
+        """Existence probe via access(F_OK), which skips filling a stat struct"""
+        return os.access(path, os.F_OK)
+
+
+# Interpreter paths already found on disk. Misses are not remembered, so an
+# interpreter installed while the process runs is picked up on the next check.
+_found_executables: Set[str] = set()
+
+
+def _executable_exists(path: str) -> bool:
+    """Check an interpreter path, skipping the probe once it has been found"""
+    if path in _found_executables:
+        return True
+    if os.path.exists(path):
+        _found_executables.add(path)
+        return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def _python_executable() -> str:
+    """Current interpreter path; fixed for the process lifetime"""
+    return sys.executable
+
+
+@lru_cache(maxsize=None)
+def _package_path() -> Path:
+    """Installed package location; fixed for the process lifetime"""
+    import mcp_visualization
+    return Path(mcp_visualization.__file__).parent
+
+
+@lru_cache(maxsize=None)
+def _package_parent_posix() -> str:
+    """Server working directory as a forward-slash string, built once"""
+    return _package_path().parent.as_posix()
+
+
+@lru_cache(maxsize=None)
+def _default_database_path() -> Path:
+    """Default database location; fixed for the process lifetime"""
+    return Path.home() / '.mcp-visualization' / 'data.duckdb'
+
 
 class ClaudeDesktopConfigManager:
     """Manages Claude Desktop configuration for MCP server integration"""
 
+    # Config file location relative to the home directory, per platform
+    _CONFIG_PATHS: ClassVar[Dict[str, str]] = {
+        'Windows': 'AppData/Roaming/Claude/claude_desktop_config.json',
+        'Darwin': 'Library/Application Support/Claude/claude_desktop_config.json',
+        'Linux': '.config/claude/claude_desktop_config.json'
+    }
+
+    # The platform cannot change during the process lifetime
+    _PLATFORM: ClassVar[str] = platform.system()
+
     def __init__(self):
-        self.platform = platform.system()
+        self.platform = self._PLATFORM
         self.config_path = self._find_claude_config_path()
+        self._config_exists: Optional[bool] = None
+        self._status_cache: Optional[Tuple[Optional[int], Dict[str, Any]]] = None
+        self._servers_cache: Optional[Dict[str, Any]] = None
+        self._server_names_cache: Optional[Tuple[int, FrozenSet[str]]] = None
+        self._config_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         
     def _find_claude_config_path(self) -> Path:
         """Find Claude Desktop config file based on platform"""
-        config_paths = {
-            'Windows': Path.home() / 'AppData/Roaming/Claude/claude_desktop_config.json',
-            'Darwin': Path.home() / 'Library/Application Support/Claude/claude_desktop_config.json',
-            'Linux': Path.home() / '.config/claude/claude_desktop_config.json'
-        }
-        
-        if self.platform not in config_paths:
+        if self.platform not in self._CONFIG_PATHS:
             raise RuntimeError(f"Unsupported platform: {self.platform}")
             
-        return config_paths[self.platform]
+        return _resolve_config_path(self._CONFIG_PATHS[self.platform])
+    
+    def _config_mtime_ns(self) -> Optional[int]:
+        """Modification time of the config file, or None if it does not exist"""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
     
     def config_exists(self) -> bool:
         """Check if Claude Desktop config file exists"""
-        return self.config_path.exists()
+        # Cached until this manager writes the config file itself
+        if self._config_exists is None:
+            self._config_exists = _fast_exists(self.config_path)
+        return self._config_exists
     
     def create_config_directory(self) -> None:
         """Create Claude Desktop config directory if it doesn't exist"""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created directory: {self.config_path.parent}")
     
-    def load_existing_config(self) -> Dict[str, Any]:
-        """Load existing Claude Desktop configuration"""
-        if not self.config_exists():
+    def _read_config(self) -> Dict[str, Any]:
+        """Parsed config file, re-read only when its modification time changes"""
+        mtime_ns = self._config_mtime_ns()
+        if mtime_ns is None:
             return {"mcpServers": {}}
+        
+        cached = self._config_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
             
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _loads_config(self.config_path.read_bytes())
                 
             # Ensure mcpServers section exists
-            if "mcpServers" not in config:
-                config["mcpServers"] = {}
-                
-            return config
+            config.setdefault("mcpServers", {})
         except (json.JSONDecodeError, FileNotFoundError) as e:
             logger.warning(f"Error reading existing config: {e}")
             return {"mcpServers": {}}
+        
+        self._config_cache = (mtime_ns, config)
+        return config
+    
+    def load_existing_config(self) -> Dict[str, Any]:
+        """Load existing Claude Desktop configuration"""
+        # Callers add and remove servers on the result, so hand out copies of
+        # the two mutable levels rather than the cached dict itself
+        config = dict(self._read_config())
+        config["mcpServers"] = dict(config["mcpServers"])
+        return config
+    
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """Write the full configuration back to disk atomically"""
+        # Write a sibling temp file and rename it over the config so a crash
+        # mid-write can never leave Claude Desktop with a truncated file
+        tmp_path = self.config_path.with_suffix('.json.tmp')
+        tmp_path.write_bytes(_dumps_config(config))
+        os.replace(tmp_path, self.config_path)
+        self._config_exists = True
+        self._status_cache = None
+        self._servers_cache = None
+        self._server_names_cache = None
+        self._config_cache = None
     
     def backup_config(self) -> Optional[Path]:
         """Create backup of existing configuration"""
@@ -66,13 +189,13 @@ class ClaudeDesktopConfigManager:
             return None
             
         backup_path = self.config_path.with_suffix('.json.backup')
-        shutil.copy2(self.config_path, backup_path)
+        shutil.copyfile(self.config_path, backup_path)
         logger.info(f"Created backup: {backup_path}")
         return backup_path
     
     def get_python_executable(self) -> str:
         """Get current Python executable path"""
-        return sys.executable
+        return _python_executable()
     
     def validate_python_path(self, python_path: str) -> bool:
         """Validate that the Python path is executable"""
@@ -95,12 +218,11 @@ class ClaudeDesktopConfigManager:
     
     def get_package_path(self) -> Path:
         """Get installed package location"""
-        import mcp_visualization
-        return Path(mcp_visualization.__file__).parent
+        return _package_path()
     
     def get_default_database_path(self) -> Path:
         """Get default database path in user's home directory"""
-        return Path.home() / '.mcp-visualization' / 'data.duckdb'
+        return _default_database_path()
     
     def get_suggested_database_paths(self) -> list[Path]:
         """Get suggested database locations for user to choose from"""
@@ -126,8 +248,8 @@ class ClaudeDesktopConfigManager:
         print(f"Getting package path...")
         # Convert paths to strings for JSON serialization
         # Use forward slashes even on Windows for consistency
-        python_str = str(Path(python_path)).replace('\\', '/')
-        package_path = str(self.get_package_path().parent).replace('\\', '/')
+        python_str = Path(python_path).as_posix()
+        package_path = _package_parent_posix()
         
         print(f"Creating base config...")
         config = {
@@ -175,7 +297,8 @@ class ClaudeDesktopConfigManager:
             
             print(f"Checking for existing server '{server_name}'...")
             # Check if server already exists
-            if server_name in config["mcpServers"]:
+            servers = config["mcpServers"]
+            if server_name in servers:
                 return False, f"Server '{server_name}' already exists in configuration"
             
             print(f"Creating server configuration...")
@@ -188,12 +311,11 @@ class ClaudeDesktopConfigManager:
             
             print(f"Adding server to configuration...")
             # Add server to configuration
-            config["mcpServers"][server_name] = server_config
+            servers[server_name] = server_config
             
             print(f"Writing configuration file...")
             # Write updated configuration
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_config(config)
             
             logger.info(f"Successfully added '{server_name}' to Claude Desktop configuration")
             return True, f"Successfully configured '{server_name}' for Claude Desktop"
@@ -211,18 +333,18 @@ class ClaudeDesktopConfigManager:
             
             config = self.load_existing_config()
             
-            if server_name not in config["mcpServers"]:
+            servers = config["mcpServers"]
+            if server_name not in servers:
                 return False, f"Server '{server_name}' not found in configuration"
             
             # Backup before removal
             self.backup_config()
             
             # Remove server
-            del config["mcpServers"][server_name]
+            del servers[server_name]
             
             # Write updated configuration
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_config(config)
             
             logger.info(f"Successfully removed '{server_name}' from Claude Desktop configuration")
             return True, f"Successfully removed '{server_name}' from Claude Desktop"
@@ -238,13 +360,22 @@ class ClaudeDesktopConfigManager:
                          python_path: Optional[str] = None) -> Tuple[bool, str]:
         """Update existing MCP server configuration"""
         try:
-            # First remove the existing server
-            success, message = self.remove_mcp_server(server_name)
-            if not success and "not found" not in message:
-                return False, message
+            self.create_config_directory()
             
-            # Then add it back with new configuration
-            return self.add_mcp_server(server_name, database_path, python_path, backup=False)
+            # Backup once, then replace the server entry in a single write
+            if self.config_exists():
+                self.backup_config()
+            
+            config = self.load_existing_config()
+            config["mcpServers"][server_name] = self.create_server_config(
+                server_name=server_name,
+                database_path=database_path,
+                python_path=python_path
+            )
+            self._write_config(config)
+            
+            logger.info(f"Successfully updated '{server_name}' in Claude Desktop configuration")
+            return True, f"Successfully configured '{server_name}' for Claude Desktop"
             
         except Exception as e:
             error_msg = f"Failed to update server configuration: {e}"
@@ -253,8 +384,32 @@ class ClaudeDesktopConfigManager:
     
     def list_mcp_servers(self) -> Dict[str, Any]:
         """List all configured MCP servers"""
-        config = self.load_existing_config()
-        return config.get("mcpServers", {})
+        # Parsed once per manager and dropped whenever the config is written
+        if self._servers_cache is None:
+            self._servers_cache = self._read_config().get("mcpServers", {})
+        # Shallow copy so callers cannot alter the cached mapping
+        return dict(self._servers_cache)
+    
+    def server_names(self) -> FrozenSet[str]:
+        """Names of all configured MCP servers, reloaded only when the config file changes"""
+        mtime_ns = self._config_mtime_ns()
+        if mtime_ns is None:
+            return frozenset()
+        
+        cached = self._server_names_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # The file changed on disk (possibly edited by hand), so drop the parsed servers too
+        self._config_exists = True
+        self._servers_cache = None
+        names = frozenset(self.list_mcp_servers())
+        self._server_names_cache = (mtime_ns, names)
+        return names
+    
+    def has_server(self, server_name: str) -> bool:
+        """Check whether a server is already configured"""
+        return server_name in self.server_names()
     
     def validate_config(self) -> Tuple[bool, str]:
         """Validate Claude Desktop configuration"""
@@ -262,7 +417,7 @@ class ClaudeDesktopConfigManager:
             if not self.config_exists():
                 return False, "Configuration file does not exist"
             
-            config = self.load_existing_config()
+            config = self._read_config()
             
             if "mcpServers" not in config:
                 return False, "No mcpServers section in configuration"
@@ -280,7 +435,7 @@ class ClaudeDesktopConfigManager:
                 
                 # Check if Python executable exists
                 python_path = server_config["command"]
-                if not Path(python_path).exists():
+                if not _executable_exists(python_path):
                     return False, f"Python executable not found: {python_path}"
             
             return True, f"Configuration valid with {len(servers)} server(s)"
@@ -290,11 +445,20 @@ class ClaudeDesktopConfigManager:
     
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive status of Claude Desktop configuration"""
+        # Reuse the last result until the config file changes on disk
+        mtime_ns = self._config_mtime_ns()
+        if self._status_cache is not None and self._status_cache[0] == mtime_ns:
+            status = self._status_cache[1]
+            # Copy so callers cannot alter the cached status or its server list
+            return {**status, "servers": list(status["servers"])}
+        self._config_exists = mtime_ns is not None
+        self._servers_cache = None
+        
         status = {
             "platform": self.platform,
             "config_path": str(self.config_path),
             "config_exists": self.config_exists(),
-            "config_directory_exists": self.config_path.parent.exists(),
+            "config_directory_exists": _fast_exists(self.config_path.parent),
         }
         
         if self.config_exists():
@@ -307,7 +471,8 @@ class ClaudeDesktopConfigManager:
             status["validation_message"] = "Configuration file does not exist"
             status["servers"] = []
         
-        return status
+        self._status_cache = (mtime_ns, status)
+        return {**status, "servers": list(status["servers"])}
 
 
 def configure_claude_desktop(server_name: str = "data-viz-server",
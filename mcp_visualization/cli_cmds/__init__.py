@@ -0,0 +1,6 @@
+"""
+mcp-viz subcommands, one module per command
+
+Each module is imported by the LazyGroup in `cli.py` only when its command
+is invoked (or listed in `--help`).
+"""
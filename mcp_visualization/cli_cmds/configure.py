@@ -0,0 +1,124 @@
+"""
+`mcp-viz configure`: register the server with Claude Desktop
+"""
+
+import sys
+from typing import Optional
+
+import click
+
+from ..cli import (
+    _confirm, _manager, _markup, _new_settings_table, _plain, console,
+    print_banner, print_error, print_success, print_warning,
+)
+
+CONFIGURE_NEXT_STEPS = """
+[bold green]Next steps:[/bold green]
+   1. Restart Claude Desktop completely
+   2. Open a new conversation
+   3. Try: 'What MCP servers are available?'
+   4. Try: 'Browse databases in downloads'
+   5. Try: 'Load database from downloads and create a chart'
+   6. Try: 'Show me available visualization tools'
+
+[bold cyan]Your MCP Data Visualization Server is ready![/bold cyan]
+[dim]Database files in Downloads folder can now be easily browsed and loaded![/dim]"""
+
+# Status table cell values
+_YES, _NO = "SUCCESS Yes", "ERROR No"
+
+
+@click.command()
+@click.option('--server-name', default='mcp-duckdb-viz', help='Name for the MCP server')
+@click.option('--database-path', type=click.Path(), help='Path to DuckDB database file')
+@click.option('--python-path', type=click.Path(), help='Path to Python executable')
+@click.option('--force', is_flag=True, help='Overwrite existing configuration')
+@click.option('--auto', is_flag=True, help='Use default settings without prompts')
+@click.option('--yes', '-y', is_flag=True, help='Answer yes to confirmation prompts')
+def configure(server_name: str, database_path: Optional[str], python_path: Optional[str], 
+              force: bool, auto: bool, yes: bool):
+    """Configure Claude Desktop integration"""
+    from rich.console import Group
+    from ..claude_config import configure_claude_desktop
+    
+    if not auto:
+        print_banner()
+        console.print("Config Setting up Claude Desktop integration...\n", markup=False, highlight=False)
+    
+    try:
+        manager = _manager()
+        
+        # The status table is only useful while the user is still deciding;
+        # scripted runs (--auto, or every path given) just need the names
+        show_status = not auto and not (database_path and python_path)
+        if show_status:
+            # One config read serves both the status table and the duplicate check
+            status = manager.get_status()
+            existing_servers = frozenset(status["servers"])
+        else:
+            existing_servers = manager.server_names()
+        
+        # Collect the status and summary sections and render them in one print
+        output = []
+        
+        # Show current status
+        if show_status:
+            output.append(_plain("INFO Current Configuration Status:"))
+            
+            table = _new_settings_table()
+            table.add_row("Platform", status["platform"])
+            table.add_row("Config Path", status["config_path"])
+            table.add_row("Config Exists", _YES if status["config_exists"] else _NO)
+            table.add_row("Config Valid", _YES if status["config_valid"] else _NO)
+            table.add_row("Existing Servers", ", ".join(status["servers"]) if status["servers"] else "None")
+            
+            output.extend([table, _plain("")])
+        
+        py_path = python_path
+        
+        # Auto configuration - no prompts needed
+        output.append(_plain("Auto-configuring MCP server..."))
+        
+        # Use default Python executable  
+        if not py_path:
+            py_path = manager.get_python_executable()
+        output.append(_plain(f"Using Python: {py_path}"))
+        
+        # Skip database setup (no database needed)
+        db_path = None
+        create_sample = False
+        output.append(_plain("Database-free mode (connect databases via Claude Desktop)"))
+        
+        # Show simple configuration summary
+        output.append(_plain(f"Server name: {server_name}"))
+        output.append(_plain(f"Config file: {manager.config_path}"))
+        console.print(Group(*output))
+        
+        # Check for existing server and handle gracefully
+        if not force and server_name in existing_servers:
+            print_warning(f"Server '{server_name}' already exists!")
+            if not _confirm("Do you want to update the existing configuration?", yes or auto):
+                console.print("Configuration cancelled.", markup=False, highlight=False)
+                return
+            force = True
+        
+        # Apply configuration
+        console.print("\nApplying configuration...", markup=False, highlight=False)
+        
+        success, message = configure_claude_desktop(
+            server_name=server_name,
+            database_path=db_path,
+            python_path=py_path,
+            force=force
+        )
+        
+        if success:
+            print_success(message)
+            console.print(_markup(CONFIGURE_NEXT_STEPS))
+        else:
+            print_error(message)
+            sys.exit(1)
+            
+    except Exception as e:
+        print_error(f"Configuration failed: {e}")
+        sys.exit(1)
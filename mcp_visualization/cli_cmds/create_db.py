@@ -0,0 +1,43 @@
+"""
+`mcp-viz create-db`: create a DuckDB database with sample data
+"""
+
+import os
+import sys
+from typing import Optional
+
+import click
+
+from ..cli import _manager, console, print_error, print_info, print_success
+
+
+@click.command()
+@click.option('--path', type=click.Path(), help='Path to database file')
+def create_db(path: Optional[str]):
+    """Create a new DuckDB database with sample data"""
+    
+    console.print("Database  Creating new database with sample data...\n")
+    
+    try:
+        from ..database import create_sample_database
+        
+        if not path:
+            # Same location as the manager's default database path, without
+            # constructing the manager; fall back to it if ~ cannot be expanded
+            home = os.path.expanduser("~")
+            if home != "~":
+                path = os.path.join(home, ".mcp-visualization", "data.duckdb")
+            else:
+                path = str(_manager().get_default_database_path())
+        
+        parent_dir = os.path.dirname(path)
+        if parent_dir and not os.path.isdir(parent_dir):
+            os.makedirs(parent_dir, exist_ok=True)
+        
+        db_path = create_sample_database(path)
+        print_success(f"Database created: {db_path}")
+        print_info("Database includes sample tables: sales, customers, products")
+        
+    except Exception as e:
+        print_error(f"Database creation failed: {e}")
+        sys.exit(1)
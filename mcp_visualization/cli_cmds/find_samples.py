@@ -0,0 +1,97 @@
+"""
+`mcp-viz find-samples`: locate the sample database or packaged CSVs
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import click
+
+from ..cli import console, print_error
+
+
+@click.command()
+def find_samples():
+    """Find and show sample database location"""
+    try:
+        # Check Downloads directory first (primary location); plain strings
+        # are enough for the existence checks and printing below
+        user_home = os.path.expanduser("~")
+        sample_dir = os.path.join(user_home, "Downloads", "mcp-visualization-samples")
+        sample_db = os.path.join(sample_dir, "sample.duckdb")
+        
+        # Also check backup location
+        backup_dir = os.path.join(user_home, ".mcp-visualization", "samples")
+        backup_db = os.path.join(backup_dir, "sample.duckdb")
+        
+        # Collect the report and write it with a single print at the end
+        output = ["🔍 [bold]Searching for sample databases...[/bold]\n"]
+        
+        if os.path.exists(sample_db):
+            size_mb = os.stat(sample_db).st_size / (1024 * 1024)
+            output.append(f"✅ [green]Sample database found![/green]")
+            output.append(f"   📍 Location: {sample_db}")
+            output.append(f"   📊 Size: {size_mb:.2f} MB")
+            output.append(f"   📁 Directory: {sample_dir}")
+            
+            # Check if backup also exists
+            if os.path.exists(backup_db):
+                output.append(f"   🔄 Backup: {backup_db}")
+            
+            # Check if README exists
+            readme_path = os.path.join(sample_dir, "README.md")
+            if os.path.exists(readme_path):
+                output.append(f"   📝 Documentation: {readme_path}")
+            
+            output.append(f"\n💡 [cyan]To use this database:[/cyan]")
+            output.append(f'   • Say: "Load database from {sample_db}"')
+            output.append(f'   • Or configure it permanently with: mcp-viz configure')
+            
+        elif os.path.exists(backup_db):
+            size_mb = os.stat(backup_db).st_size / (1024 * 1024)
+            output.append(f"✅ [green]Sample database found in backup location![/green]")
+            output.append(f"   📍 Location: {backup_db}")
+            output.append(f"   📊 Size: {size_mb:.2f} MB")
+            output.append(f"   📁 Directory: {backup_dir}")
+            
+            output.append(f"\n💡 [cyan]To use this database:[/cyan]")
+            output.append(f'   • Say: "Load database from {backup_db}"')
+            output.append(f'   • Or configure it permanently with: mcp-viz configure')
+            
+        else:
+            # Check if we have CSV files in the package
+            try:
+                try:
+                    from importlib.resources import files
+                    package_data_dir = Path(str(files('mcp_visualization').joinpath('data')))
+                except ImportError:
+                    # Python 3.8 has no importlib.resources.files()
+                    package_data_dir = Path(__file__).parent.parent / "data"
+                csv_files = list(package_data_dir.glob("*.csv"))
+                
+                if csv_files:
+                    output.append("📊 [yellow]Sample CSV files found in package[/yellow]")
+                    output.append(f"   📁 Package data: {package_data_dir}")
+                    for csv_file in csv_files:
+                        output.append(f"   - {csv_file.name}")
+                    output.append(f"\n💡 [cyan]To create sample database:[/cyan]")
+                    output.append(f"   Run: mcp-viz setup-samples")
+                else:
+                    output.append("❌ [red]No sample data found[/red]")
+                    output.append(f"   Expected database: {sample_db}")
+                    output.append(f"   Expected CSV files: {package_data_dir}")
+                    output.append(f"\n💡 [cyan]To set up sample database:[/cyan]")
+                    output.append(f"   Run: mcp-viz setup-samples")
+                    
+            except Exception as pkg_error:
+                output.append("❌ [red]Sample database not found[/red]")
+                output.append(f"   Expected location: {sample_db}")
+                output.append(f"\n💡 [cyan]To set up sample database:[/cyan]")
+                output.append(f"   Run: mcp-viz setup-samples")
+        
+        console.print("\n".join(output))
+            
+    except Exception as e:
+        print_error(f"Search failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,62 @@
+"""
+`mcp-viz list-servers`: show every configured MCP server
+"""
+
+import sys
+
+import click
+
+from ..cli import _manager, _plain, console, print_error, print_info
+
+
+@click.command()
+@click.option('--json', 'as_json', is_flag=True, help='Print the servers as JSON for scripts')
+def list_servers(as_json: bool):
+    """List all configured MCP servers"""
+    try:
+        manager = _manager()
+        
+        if as_json:
+            # Machine-readable fast path; an empty object when nothing is configured
+            import json
+            servers = manager.list_mcp_servers() if manager.config_exists() else {}
+            click.echo(json.dumps(servers, default=str))
+            return
+        
+        # First run: nothing to read or list
+        if not manager.config_exists():
+            print_info(f"No Claude Desktop config found at {manager.config_path}")
+            return
+        
+        servers = manager.list_mcp_servers()
+        
+        if not servers:
+            print_info("No MCP servers configured")
+            return
+        
+        from rich.table import Table
+        
+        # One row per server, rendered in a single print
+        table = Table(title="Config Configured MCP Servers")
+        # Fold rather than truncate: paths are the useful part of each cell
+        table.add_column("Name", style="bold", overflow="fold")
+        table.add_column("Command", overflow="fold")
+        table.add_column("Args", overflow="fold")
+        table.add_column("Working Dir", overflow="fold")
+        table.add_column("Environment", overflow="fold")
+        
+        for name, config in servers.items():
+            env = "\n".join(f"{key}: {value}" for key, value in config.get('env', {}).items())
+            table.add_row(
+                _plain(name),
+                _plain(config.get('command', 'N/A')),
+                _plain(' '.join(config.get('args', []))),
+                _plain(config.get('cwd', 'N/A')),
+                _plain(env),
+            )
+        
+        console.print(table)
+            
+    except Exception as e:
+        print_error(f"Failed to list servers: {e}")
+        sys.exit(1)
@@ -0,0 +1,55 @@
+"""
+`mcp-viz remove`: drop a server from the Claude Desktop configuration
+"""
+
+import sys
+
+import click
+
+from ..cli import _confirm, _manager, console, print_error, print_info, print_success, print_warning
+
+
+@click.command()
+@click.option('--server-name', default='mcp-duckdb-viz', help='Name of the MCP server to remove')
+@click.option('--yes', '-y', is_flag=True, help='Remove without asking for confirmation')
+def remove(server_name: str, yes: bool):
+    """Remove MCP server from Claude Desktop configuration"""
+    
+    print("🗑️  Removing MCP server configuration...\n")
+    
+    try:
+        manager = _manager()
+        
+        # First run: nothing to read or remove
+        if not manager.config_exists():
+            print_info(f"No Claude Desktop config found at {manager.config_path}")
+            return
+        
+        # Show current servers
+        servers = manager.list_mcp_servers()
+        if not servers:
+            print_warning("No MCP servers found in configuration")
+            return
+        
+        if server_name not in manager.server_names():
+            print_error(f"Server '{server_name}' not found")
+            console.print("Available servers:\n" + "\n".join(f"  • {name}" for name in servers))
+            return
+        
+        # Confirm removal
+        if not _confirm(f"Remove server '{server_name}' from Claude Desktop configuration?", yes):
+            console.print("Removal cancelled.")
+            return
+        
+        success, message = manager.remove_mcp_server(server_name)
+        
+        if success:
+            print_success(message)
+            print_info("Please restart Claude Desktop to apply changes")
+        else:
+            print_error(message)
+            sys.exit(1)
+            
+    except Exception as e:
+        print_error(f"Removal failed: {e}")
+        sys.exit(1)
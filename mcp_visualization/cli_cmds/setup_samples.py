@@ -0,0 +1,29 @@
+"""
+`mcp-viz setup-samples`: extract the packaged sample database
+"""
+
+import os
+import sys
+
+import click
+
+from ..cli import print_error, print_info
+
+
+@click.command()
+@click.option('--force', is_flag=True, help='Rebuild the sample database even if it already exists')
+def setup_samples(force: bool):
+    """Extract and set up sample database from package"""
+    # Re-runs are common; skip importing the installer (and DuckDB) when the
+    # sample database find-samples looks for first is already in place
+    sample_db = os.path.join(os.path.expanduser("~"), "Downloads", "mcp-visualization-samples", "sample.duckdb")
+    if not force and os.path.exists(sample_db):
+        print_info(f"Sample database already present at {sample_db}; skipping (use --force to rebuild)")
+        return 0
+    
+    try:
+        from ..install_helper import main as install_main
+        return install_main()
+    except Exception as e:
+        print_error(f"Sample setup failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,92 @@
+"""
+`mcp-viz status`: report the Claude Desktop integration state
+"""
+
+import sys
+
+import click
+
+from ..cli import (
+    _manager, _markup, _new_settings_table, _server_import_ok, console,
+    print_error, print_info, print_success,
+)
+
+# Platform table cell values
+_EXISTS, _MISSING = "SUCCESS Exists", "ERROR Missing"
+
+
+@click.command()
+@click.option('--skip-import-test/--import-test', default=False,
+              help='Skip importing the server package (the slowest check)')
+@click.option('--json', 'as_json', is_flag=True, help='Print the status as JSON for scripts')
+def status(skip_import_test: bool, as_json: bool):
+    """Show configuration status"""
+    if as_json:
+        # Machine-readable fast path: no header, no Rich, no import test
+        import json
+        try:
+            click.echo(json.dumps(_manager().get_status(), default=str))
+        except Exception as e:
+            print_error(f"Status check failed: {e}")
+            sys.exit(1)
+        return
+    
+    # Plain prints until there is something to render, so the no-config
+    # path below never imports Rich
+    print("CHART MCP Data Visualization Server Status\n")
+    
+    try:
+        manager = _manager()
+        status = manager.get_status()
+        
+        # Nothing else is meaningful before the first configure, so skip the
+        # tables and the (slow) server import test
+        if not status["config_exists"]:
+            print_error(f"No Claude Desktop config found at {status['config_path']}")
+            print("Run: mcp-viz configure")
+            return
+        
+        from rich.console import Group
+        
+        # Collect every section and render them in one print
+        output = []
+        
+        # Platform info
+        output.append(_markup("COMPUTER  Platform Information:"))
+        platform_table = _new_settings_table()
+        platform_table.add_row("Operating System", status["platform"])
+        platform_table.add_row("Config Path", status["config_path"])
+        platform_table.add_row("Config Directory", _EXISTS if status["config_directory_exists"] else _MISSING)
+        platform_table.add_row("Config File", _EXISTS if status["config_exists"] else _MISSING)
+        
+        output.extend([platform_table, ""])
+        
+        # Configuration validation
+        output.append(_markup("SEARCH Configuration Validation:"))
+        valid_icon = "SUCCESS" if status["config_valid"] else "ERROR"
+        output.append(f"{valid_icon} {status['validation_message']}")
+        output.append("")
+        
+        # MCP servers
+        output.append(_markup("Config Configured MCP Servers:"))
+        if status["servers"]:
+            output.append("\n".join(f"  {i}. {server}" for i, server in enumerate(status["servers"], 1)))
+        else:
+            output.append("  No servers configured")
+        output.append("")
+        
+        # Server test
+        output.append(_markup("🧪 Server Import Test:"))
+        console.print(Group(*output))
+        if skip_import_test:
+            print_info("Skipped (run without --skip-import-test or use 'mcp-viz test')")
+            return
+        try:
+            _server_import_ok()
+            print_success("Server code can be imported successfully")
+        except Exception as e:
+            print_error(f"Server import failed: {e}")
+        
+    except Exception as e:
+        print_error(f"Status check failed: {e}")
+        sys.exit(1)
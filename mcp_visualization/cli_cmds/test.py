@@ -0,0 +1,67 @@
+"""
+`mcp-viz test`: run the installation self-tests
+"""
+
+import sys
+
+import click
+
+from ..cli import _ensure_parent_dir, _manager, _plain, _server_import_ok, console, print_success, print_warning
+
+# Status cells for the results table
+_PASS, _FAIL = "[bold green]SUCCESS PASS[/bold green]", "[bold red]ERROR FAIL[/bold red]"
+
+
+def _test_claude_status():
+    """Self-test: detect the Claude Desktop configuration"""
+    return _manager().get_status()
+
+
+def _test_db_path_mkdir():
+    """Self-test: make sure the default database directory can be created"""
+    _ensure_parent_dir(_manager().get_default_database_path())
+
+
+# Checks run by `mcp-viz test`, in order
+_SELF_TESTS = (
+    ("Import server module", _server_import_ok),
+    ("Claude Desktop config detection", _test_claude_status),
+    ("Database path creation", _test_db_path_mkdir),
+)
+
+
+@click.command()
+def test():
+    """Test server functionality"""
+    
+    console.print("🧪 Testing MCP Data Visualization Server\n")
+    
+    # Run everything first, then render the results as a single table
+    results = []
+    for test_name, test_func in _SELF_TESTS:
+        try:
+            test_func()
+            results.append((test_name, True, ""))
+        except Exception as e:
+            results.append((test_name, False, str(e)))
+    
+    from rich.table import Table
+    
+    table = Table()
+    table.add_column("Test", style="cyan")
+    table.add_column("Status")
+    table.add_column("Error", style="red")
+    for test_name, ok, error in results:
+        table.add_row(test_name, _PASS if ok else _FAIL, _plain(error))
+    console.print(table)
+    
+    passed = sum(ok for _, ok, _ in results)
+    total = len(results)
+    
+    console.print()
+    if passed == total:
+        print_success(f"All {total} tests passed! COMPLETE")
+    else:
+        print_warning(f"{passed}/{total} tests passed")
+        if passed < total:
+            sys.exit(1)
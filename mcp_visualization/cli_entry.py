@@ -0,0 +1,70 @@
+"""
+Console-script entry point for the mcp-viz CLI
+
+Top-level `--help`, `--version` and a bare `mcp-viz` are answered here with
+plain print() so they never import click, rich or the CLI module. Everything
+else falls through to the full click application in `cli.py`.
+"""
+
+import sys
+
+DISTRIBUTION_NAME = "mcp-visualization-duckdb"
+PROG_NAME = "mcp-viz"
+
+# Mirrors click's rendering of `mcp-viz --help`; keep in sync with cli.main
+MAIN_HELP = """\
+Usage: mcp-viz [OPTIONS] COMMAND [ARGS]...
+
+  MCP Data Visualization Server CLI
+
+Options:
+  -V, --version  Show the version and exit.
+  --help         Show this message and exit.
+
+Commands:
+  configure      Configure Claude Desktop integration
+  create-db      Create a new DuckDB database with sample data
+  databricks     Databricks integration commands (run once for setup,...
+  find-samples   Find and show sample database location
+  list-servers   List all configured MCP servers
+  remove         Remove MCP server from Claude Desktop configuration
+  setup-samples  Extract and set up sample database from package
+  status         Show configuration status
+  test           Test server functionality"""
+
+
+def _installed_version() -> str:
+    """Installed distribution version, or an empty string when not installed"""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return ""
+    try:
+        return version(DISTRIBUTION_NAME)
+    except PackageNotFoundError:
+        return ""
+
+
+def version_message() -> str:
+    """The `--version` line, preferring installed metadata over __version__"""
+    from . import __version__
+    return f"{PROG_NAME}, version {_installed_version() or __version__}"
+
+
+def main():
+    """Run the mcp-viz CLI, answering help and version without loading click"""
+    argv = sys.argv
+    if len(argv) <= 1 or (len(argv) == 2 and argv[1] == "--help"):
+        print(MAIN_HELP)
+        sys.exit(0)
+
+    if len(argv) == 2 and argv[1] in ("-V", "--version"):
+        print(version_message())
+        sys.exit(0)
+
+    from .cli import main as cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,18 +6,72 @@ Configuration management for MCP Data Visualization Server
 """
 
 import os
+import re
 import logging
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Literal
-import yaml  # Still needed if you explicitly load YAML in other parts, but not for the main settings load anymore
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, SecretStr
+from string import Formatter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+import yaml
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+    YamlConfigSettingsSource,
+)
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SecretStr,
+    field_validator,
+    model_validator,
+)
+
+logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Six or more ';' separators: the OS PATH leaked into the database path
+_SYSTEM_PATH_RE = re.compile(r"(?:;[^;]*){6}")
 # print(f"Project root set to: {PROJECT_ROOT}")
 
+# Only sections that read environment variables are settings (EnvSection); the
+# rest are plain BaseModels so building Settings() does not rescan the
+# environment for every nested section.
+
+
+class EnvSection(BaseSettings):
+    """Nested settings section that reads only init values and environment variables"""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Skip the .env and secrets sources; only the top-level Settings reads .env"""
+        return (init_settings, env_settings)
 
-class ConnectionConfig(BaseSettings):
+
+class ConnectionConfig(EnvSection):
     """Database connection configuration"""
 
     model_config = SettingsConfigDict(
@@ -34,50 +88,69 @@ class ConnectionConfig(BaseSettings):
     timeout: int = 30
     read_only: bool = False
 
-    def __post_init__(self):
-        """Ensure database directory exists and validate path"""
-        # Convert string path to Path object if needed
-        if isinstance(self.path, str):
-            self.path = Path(self.path)
-
-        # Check if we accidentally got the system PATH
-        path_str = str(self.path)
-        if ";" in path_str and path_str.count(";") > 5:
-            # This is definitely the system PATH, override it
-            self.path = PROJECT_ROOT / "data" / "mcp.duckdb"
-            print(
-                f"WARNING  Detected system PATH in database config, overriding to: {self.path}"
+    # Parent directories already created this process
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _reject_system_path(cls, value: Any) -> Any:
+        """Replace a leaked system PATH with DUCKDB_DATABASE_PATH or the default"""
+        if _SYSTEM_PATH_RE.search(str(value)):
+            value = (
+                os.getenv("DUCKDB_DATABASE_PATH")
+                or PROJECT_ROOT / "data" / "mcp.duckdb"
+            )
+            logger.warning(
+                f"Detected system PATH in database config, overriding to: {value}"
             )
+        return value
+
+    @model_validator(mode="after")
+    def _normalize_path(self) -> "ConnectionConfig":
+        """Make the path absolute and create its directory"""
+        if str(self.path) == ":memory:":
+            return self
 
         # Ensure it's an absolute path
         if not self.path.is_absolute():
             self.path = PROJECT_ROOT / self.path
 
-        # Create directory if it doesn't exist
-        if str(self.path) != ":memory:":
-            self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Create directory if it doesn't exist, once per directory per process
+        parent = self.path.parent
+        if parent not in ConnectionConfig._ensured_dirs:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+                ConnectionConfig._ensured_dirs.add(parent)
+            except OSError as e:
+                logger.debug(f"Could not create database directory {parent}: {e}")
 
-        print(f"SUCCESS Database path: {self.path}")
-        print(f"SUCCESS Database directory exists: {self.path.parent.exists()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Database path: %s", self.path)
+        return self
 
 
-class DatabaseSettings(BaseSettings):
+class DatabaseSettings(BaseModel):
     """Specific DuckDB settings"""
 
     memory_limit: str = "1GB"
     threads: int = 4
     enable_extensions: bool = True
+    pool_size: int = Field(
+        default=4,
+        ge=1,
+        description="Number of cursors DatabaseManager hands out for concurrent queries.",
+    )
 
 
-class DatabaseConfig(BaseSettings):
+class DatabaseConfig(BaseModel):
     """Database configuration"""
 
     type: str = "duckdb"
-    connection: ConnectionConfig = ConnectionConfig()
-    settings: DatabaseSettings = DatabaseSettings()
+    connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
+    settings: DatabaseSettings = Field(default_factory=DatabaseSettings)
 
 
-class OllamaConfig(BaseSettings):
+class OllamaConfig(EnvSection):
     """Ollama LLM configuration"""
 
     base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
@@ -90,11 +163,47 @@ class OllamaConfig(BaseSettings):
     )
 
 
-class LLMPromptsConfig(BaseSettings):
-    """LLM Prompt templates configuration"""
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
 
-    chart_type_detection_template: str = Field(
-        default="""Analyze this data visualization request and determine the most appropriate chart type.
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once and return a renderer taking the same
+    keyword arguments, so repeated renders skip re-parsing the template.
+
+    Only plain named fields are precompiled. Templates using positional
+    fields, attribute or index lookups, or nested format specs are rendered
+    by template.format so they keep their full str.format behavior.
+    """
+    parts = [
+        (literal, field, spec, _CONVERSIONS.get(conversion))
+        for literal, field, spec, conversion in Formatter().parse(template)
+    ]
+    if any(
+        field is not None and (not field.isidentifier() or "{" in (spec or ""))
+        for _, field, spec, _ in parts
+    ):
+        return template.format
+
+    def render(**kwargs: Any) -> str:
+        chunks = []
+        for literal, field, spec, convert in parts:
+            chunks.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                if convert is not None:
+                    value = convert(value)
+                chunks.append(format(value, spec or ""))
+        return "".join(chunks)
+
+    return render
+
+
+# Default prompt templates keyed by field alias; module-level so the large
+# strings are built once at import, not held in each Field definition
+_PROMPT_DEFAULTS: Mapping[str, str] = MappingProxyType(
+    {
+        "chart_type_detection": """Analyze this data visualization request and determine the most appropriate chart type.
 
 REQUEST: "{request}"
 TABLE: {table_name}
@@ -113,11 +222,7 @@ Consider the following chart types and their use cases:
 Respond with ONLY a valid JSON object in this exact format:
 {{"chart_type": "bar|line|scatter|pie|histogram|box|heatmap|area", "confidence": 0.8, "reasoning": "explanation of why this chart type fits the request"}}
 """,
-        description="Prompt for detecting chart type from user request.",
-        alias="chart_type_detection",
-    )
-    column_suggestion_template: str = Field(
-        default="""For a {chart_type} chart with the following columns, suggest the most appropriate column mappings.
+        "column_suggestion": """For a {chart_type} chart with the following columns, suggest the most appropriate column mappings.
 
 COLUMNS: {columns}
 REQUEST CONTEXT: "{request}"
@@ -135,11 +240,7 @@ Chart type requirements:
 Respond with ONLY a valid JSON object:
 {{"suggestions": {{"x_axis": "column_name", "y_axis": "column_name", "explanation": "why these columns work well together"}}}}
 """,
-        description="Prompt for suggesting column mappings based on chart type.",
-        alias="column_suggestion",
-    )
-    insights_description_template: str = Field(
-        default="""Generate a clear, concise description of the insights from this data visualization.
+        "insights_description": """Generate a clear, concise description of the insights from this data visualization.
 
 CHART TYPE: {chart_type}
 DATA SUMMARY: {data_summary}
@@ -152,11 +253,7 @@ Write 2-3 sentences describing:
 
 Be specific about numbers and use accessible language.
 """,
-        description="Prompt for generating insights description.",
-        alias="insights_description",
-    )
-    chart_explanation_template: str = Field(
-        default="""Explain what this chart visualization shows and how to interpret it.
+        "chart_explanation": """Explain what this chart visualization shows and how to interpret it.
 
 CHART TYPE: {chart_type}
 COLUMN MAPPINGS: {column_mappings}
@@ -169,11 +266,7 @@ Provide a brief explanation that:
 
 Keep it under 100 words and use clear, non-technical language.
 """,
-        description="Prompt for explaining charts.",
-        alias="chart_explanation",
-    )
-    data_quality_check_template: str = Field(
-        default="""Analyze this dataset for potential data quality issues that might affect visualization.
+        "data_quality_check": """Analyze this dataset for potential data quality issues that might affect visualization.
 
 COLUMNS: {columns}
 SAMPLE DATA: {sample_data}
@@ -188,11 +281,7 @@ Check for:
 
 Provide brief recommendations for data preparation if needed.
 """,
-        description="Prompt for data quality checks.",
-        alias="data_quality_check",
-    )
-    followup_questions_template: str = Field(
-        default="""Based on this {chart_type} chart and the insights found, suggest 3 relevant follow-up questions that would lead to deeper analysis.
+        "followup_questions": """Based on this {chart_type} chart and the insights found, suggest 3 relevant follow-up questions that would lead to deeper analysis.
 
 CHART CONTEXT: {chart_context}
 INSIGHTS FOUND: {insights}
@@ -205,99 +294,177 @@ Generate questions that:
 
 Format as a simple numbered list.
 """,
+    }
+)
+
+
+class LLMPromptsConfig(BaseModel):
+    """LLM Prompt templates configuration"""
+
+    chart_type_detection_template: str = Field(
+        default=_PROMPT_DEFAULTS["chart_type_detection"],
+        description="Prompt for detecting chart type from user request.",
+        alias="chart_type_detection",
+    )
+    column_suggestion_template: str = Field(
+        default=_PROMPT_DEFAULTS["column_suggestion"],
+        description="Prompt for suggesting column mappings based on chart type.",
+        alias="column_suggestion",
+    )
+    insights_description_template: str = Field(
+        default=_PROMPT_DEFAULTS["insights_description"],
+        description="Prompt for generating insights description.",
+        alias="insights_description",
+    )
+    chart_explanation_template: str = Field(
+        default=_PROMPT_DEFAULTS["chart_explanation"],
+        description="Prompt for explaining charts.",
+        alias="chart_explanation",
+    )
+    data_quality_check_template: str = Field(
+        default=_PROMPT_DEFAULTS["data_quality_check"],
+        description="Prompt for data quality checks.",
+        alias="data_quality_check",
+    )
+    followup_questions_template: str = Field(
+        default=_PROMPT_DEFAULTS["followup_questions"],
         description="Prompt for generating follow-up questions.",
         alias="followup_questions",
     )
 
+    @cached_property
+    def compiled_templates(self) -> Dict[str, Callable[..., str]]:
+        """Pre-parsed renderers for each template, keyed by template alias"""
+        return {
+            "chart_type_detection": compile_template(self.chart_type_detection_template),
+            "column_suggestion": compile_template(self.column_suggestion_template),
+            "insights_description": compile_template(self.insights_description_template),
+            "chart_explanation": compile_template(self.chart_explanation_template),
+            "data_quality_check": compile_template(self.data_quality_check_template),
+            "followup_questions": compile_template(self.followup_questions_template),
+        }
 
-class LLMConfig(BaseSettings):
+
+class LLMConfig(BaseModel):
     """LLM configuration"""
 
     provider: str = "ollama"
-    ollama: OllamaConfig = OllamaConfig()
-    prompts: LLMPromptsConfig = LLMPromptsConfig()
+    ollama: OllamaConfig = Field(default_factory=OllamaConfig)
+    prompts: LLMPromptsConfig = Field(default_factory=LLMPromptsConfig)
 
 
-class FigureSizeConfig(BaseSettings):
+class FigureSizeConfig(EnvSection):
     """Figure size configuration for visualizations"""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     width: int = Field(default=800, env="VIZ_WIDTH")
     height: int = Field(default=600, env="VIZ_HEIGHT")
 
 
-class ChartDefaultsBar(BaseSettings):
+class ChartDefaultsBar(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     orientation: Literal["v", "h"] = "v"
     text_auto: bool = True
     show_legend: bool = True
 
 
-class ChartDefaultsLine(BaseSettings):
+class ChartDefaultsLine(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     mode: str = "lines+markers"
     line_width: int = 2
     marker_size: int = 6
 
 
-class ChartDefaultsScatter(BaseSettings):
+class ChartDefaultsScatter(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     mode: str = "markers"
     marker_size: int = 8
     opacity: float = 0.7
 
 
-class ChartDefaultsPie(BaseSettings):
+class ChartDefaultsPie(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     hole: float = 0.0
     text_info: str = "label+percent"
 
 
-class ChartDefaultsHistogram(BaseSettings):
+class ChartDefaultsHistogram(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     bins: int = 30
     opacity: float = 0.7
     show_distribution: bool = True
 
 
-class ChartDefaultsConfig(BaseSettings):
+class ChartDefaultsConfig(BaseModel):
     """Default settings for various chart types"""
 
-    bar: ChartDefaultsBar = ChartDefaultsBar()
-    line: ChartDefaultsLine = ChartDefaultsLine()
-    scatter: ChartDefaultsScatter = ChartDefaultsScatter()
-    pie: ChartDefaultsPie = ChartDefaultsPie()
-    histogram: ChartDefaultsHistogram = ChartDefaultsHistogram()
+    bar: ChartDefaultsBar = Field(default_factory=ChartDefaultsBar)
+    line: ChartDefaultsLine = Field(default_factory=ChartDefaultsLine)
+    scatter: ChartDefaultsScatter = Field(default_factory=ChartDefaultsScatter)
+    pie: ChartDefaultsPie = Field(default_factory=ChartDefaultsPie)
+    histogram: ChartDefaultsHistogram = Field(default_factory=ChartDefaultsHistogram)
 
 
-class VisualizationConfig(BaseSettings):
+class VisualizationConfig(EnvSection):
     """Visualization configuration"""
 
     default_theme: str = Field(default="plotly_white", env="VIZ_THEME")
     output_format: str = "html"
-    figure_size: FigureSizeConfig = FigureSizeConfig()
+    figure_size: FigureSizeConfig = Field(default_factory=FigureSizeConfig)
     color_schemes: Dict[str, Any] = {
         "categorical": ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"],
         "sequential": "Blues",
         "diverging": "RdBu",
     }
-    chart_defaults: ChartDefaultsConfig = ChartDefaultsConfig()
+    chart_defaults: ChartDefaultsConfig = Field(default_factory=ChartDefaultsConfig)
     max_rows_for_charts: int = Field(
         default=100000,
         description="Maximum rows to load into memory for chart generation to avoid OOM.",
     )
 
 
-class TrendDetectionConfig(BaseSettings):
+class TrendDetectionConfig(BaseModel):
     """Trend detection settings"""
 
+    model_config = ConfigDict(frozen=True)
+
     min_points: int = 5
     significance_level: float = 0.05
 
 
-class FormattingConfig(BaseSettings):
+class FormattingConfig(BaseModel):
     """Formatting settings for insights"""
 
+    model_config = ConfigDict(frozen=True)
+
     decimal_places: int = 2
     percentage_format: str = ".1%"
     large_number_format: str = ".2e"
 
+    # Formatters bound to the configured specs, built once per instance
+    @cached_property
+    def format_decimal(self) -> Callable[[float], float]:
+        places = self.decimal_places
+        return lambda value: round(value, places)
+
+    @cached_property
+    def format_percentage(self) -> Callable[[float], str]:
+        spec = self.percentage_format
+        return lambda value: format(value, spec)
+
+    @cached_property
+    def format_large_number(self) -> Callable[[float], str]:
+        spec = self.large_number_format
+        return lambda value: format(value, spec)
+
 
-class InsightsConfig(BaseSettings):
+class InsightsConfig(BaseModel):
     """Insights configuration"""
 
     enabled_types: List[str] = [
@@ -311,102 +478,121 @@ class InsightsConfig(BaseSettings):
         "trend",
     ]
     correlation_threshold: float = 0.5
-    trend_detection: TrendDetectionConfig = TrendDetectionConfig()
-    formatting: FormattingConfig = FormattingConfig()
+    trend_detection: TrendDetectionConfig = Field(default_factory=TrendDetectionConfig)
+    formatting: FormattingConfig = Field(default_factory=FormattingConfig)
 
 
-class PreprocessingConfig(BaseSettings):
+class PreprocessingConfig(BaseModel):
     """Data preprocessing configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     auto_detect_types: bool = True
     handle_missing_values: bool = True
     date_formats: List[str] = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S"]
 
 
-class SamplingConfig(BaseSettings):
+class SamplingConfig(BaseModel):
     """Data sampling configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     large_dataset_threshold: int = 100000
     sample_size: int = 10000
     sampling_method: Literal["random", "systematic", "stratified"] = "random"
 
 
-class DataConfig(BaseSettings):
+class DataConfig(BaseModel):
     """Data Processing Configuration"""
 
     max_rows_preview: int = 1000
     max_file_size_mb: int = 100
     supported_formats: List[str] = ["csv", "parquet", "json", "xlsx"]
-    preprocessing: PreprocessingConfig = PreprocessingConfig()
-    sampling: SamplingConfig = SamplingConfig()
+    preprocessing: PreprocessingConfig = Field(default_factory=PreprocessingConfig)
+    sampling: SamplingConfig = Field(default_factory=SamplingConfig)
 
 
-class FileAccessConfig(BaseSettings):
+class FileAccessConfig(EnvSection):
     """File access security configuration"""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     allowed_paths: List[Path] = Field(
         default=[Path("./data/"), Path("./samples/")], env="ALLOWED_PATHS"
     )
     blocked_extensions: List[str] = [".exe", ".bat", ".sh", ".py"]
 
 
-class SecurityConfig(BaseSettings):
+class SecurityConfig(BaseModel):
     """Security configuration"""
 
     max_query_length: int = 10000
-    allowed_sql_keywords: List[str] = [
-        "SELECT",
-        "FROM",
-        "WHERE",
-        "GROUP BY",
-        "ORDER BY",
-        "LIMIT",
-        "JOIN",
-        "INNER JOIN",
-        "LEFT JOIN",
-        "RIGHT JOIN",
-        "AS",
-        "ON",
-        "AND",
-        "OR",
-        "IN",
-        "NOT IN",
-        "LIKE",
-        "ILIKE",
-        "COUNT",
-        "SUM",
-        "AVG",
-        "MIN",
-        "MAX",
-    ]
-    blocked_sql_keywords: List[str] = [
-        "DROP",
-        "DELETE",
-        "INSERT",
-        "UPDATE",
-        "CREATE",
-        "ALTER",
-        "TRUNCATE",
-        "ATTACH",
-        "DETACH",
-        "COPY",
-        "PRAGMA",
-        "SET",
-        "SYSTEM",
-        "EXEC",
-        "CALL",
-    ]
-    file_access: FileAccessConfig = FileAccessConfig()
+    # Frozen, upper-cased sets: O(1) membership checks in validate_sql_query
+    allowed_sql_keywords: FrozenSet[str] = frozenset(
+        {
+            "SELECT",
+            "FROM",
+            "WHERE",
+            "GROUP BY",
+            "ORDER BY",
+            "LIMIT",
+            "JOIN",
+            "INNER JOIN",
+            "LEFT JOIN",
+            "RIGHT JOIN",
+            "AS",
+            "ON",
+            "AND",
+            "OR",
+            "IN",
+            "NOT IN",
+            "LIKE",
+            "ILIKE",
+            "COUNT",
+            "SUM",
+            "AVG",
+            "MIN",
+            "MAX",
+        }
+    )
+    blocked_sql_keywords: FrozenSet[str] = frozenset(
+        {
+            "DROP",
+            "DELETE",
+            "INSERT",
+            "UPDATE",
+            "CREATE",
+            "ALTER",
+            "TRUNCATE",
+            "ATTACH",
+            "DETACH",
+            "COPY",
+            "PRAGMA",
+            "SET",
+            "SYSTEM",
+            "EXEC",
+            "CALL",
+        }
+    )
+    file_access: FileAccessConfig = Field(default_factory=FileAccessConfig)
+
+    @field_validator("allowed_sql_keywords", "blocked_sql_keywords", mode="before")
+    @classmethod
+    def _upper_keywords(cls, value: Any) -> Any:
+        """Accept any iterable of keywords (e.g. a YAML list) and upper-case them"""
+        if isinstance(value, str):
+            value = [value]
+        return frozenset(keyword.upper() for keyword in value)
 
 
-class SampleDatasetConfig(BaseSettings):
+class SampleDatasetConfig(BaseModel):
     """Configuration for a single sample dataset"""
 
     name: str
     file: Path  # This is already Path, which is good
 
 
-class SampleDataConfig(BaseSettings):
+class SampleDataConfig(EnvSection):
     """Sample data generation configuration"""
 
     generate_on_startup: bool = Field(default=True, env="GENERATE_SAMPLE_DATA")
@@ -419,23 +605,23 @@ class SampleDataConfig(BaseSettings):
     ]
 
 
-class TestingConfig(BaseSettings):
+class TestingConfig(BaseModel):
     """Testing specific configuration"""
 
     use_test_database: bool = True
     test_data_size: int = 100
 
 
-class DevelopmentConfig(BaseSettings):
+class DevelopmentConfig(EnvSection):
     """Development configuration"""
 
     debug_mode: bool = Field(default=True, env="DEBUG_MODE")
     auto_reload: bool = Field(default=True, env="AUTO_RELOAD")
-    sample_data: SampleDataConfig = SampleDataConfig()
-    testing: TestingConfig = TestingConfig()
+    sample_data: SampleDataConfig = Field(default_factory=SampleDataConfig)
+    testing: TestingConfig = Field(default_factory=TestingConfig)
 
 
-class ServerConfig(BaseSettings):
+class ServerConfig(EnvSection):
     """Server configuration"""
 
     name: str = "mcp-duckdb-viz"
@@ -445,6 +631,30 @@ class ServerConfig(BaseSettings):
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
 
 
+# Packaged YAML defaults. Anchored to this directory so a config.yaml in the
+# working directory is never picked up by accident.
+CONFIG_YAML_PATH = Path(__file__).parent / "config.yaml"
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_file(path: str, mtime_ns: int, encoding: Optional[str]) -> Dict[str, Any]:
+    """Parse a YAML config file once per (path, modification time)"""
+    with open(path, encoding=encoding) as yaml_file:
+        return yaml.safe_load(yaml_file) or {}
+
+
+class CachedYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """YAML settings source that reuses the parsed file until it changes on disk"""
+
+    def _read_file(self, file_path: Path) -> Dict[str, Any]:
+        # Missing files never get here: the base class skips non-files
+        return dict(
+            _load_yaml_file(
+                str(file_path), file_path.stat().st_mtime_ns, self.yaml_file_encoding
+            )
+        )
+
+
 # --- Main Settings Class ---
 class Settings(BaseSettings):
     """Main settings class"""
@@ -454,24 +664,59 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
-        # Added yaml_file and yaml_file_encoding to enable automatic loading
-        yaml_file="config.yaml",
+        yaml_file=CONFIG_YAML_PATH,
         yaml_file_encoding="utf-8",
     )
-    server: ServerConfig = ServerConfig()
-    database: DatabaseConfig = DatabaseConfig()
-    llm: LLMConfig = LLMConfig()
-    visualization: VisualizationConfig = VisualizationConfig()
-    insights: InsightsConfig = InsightsConfig()
-    security: SecurityConfig = SecurityConfig()
-    data: DataConfig = DataConfig()
-    development: DevelopmentConfig = DevelopmentConfig()
+    server: ServerConfig = Field(default_factory=ServerConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    llm: LLMConfig = Field(default_factory=LLMConfig)
+    visualization: VisualizationConfig = Field(default_factory=VisualizationConfig)
+    insights: InsightsConfig = Field(default_factory=InsightsConfig)
+    security: SecurityConfig = Field(default_factory=SecurityConfig)
+    data: DataConfig = Field(default_factory=DataConfig)
+    development: DevelopmentConfig = Field(default_factory=DevelopmentConfig)
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Add the YAML file after env/.env, parsed at most once per file version"""
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            CachedYamlConfigSettingsSource(settings_cls),
+            file_secret_settings,
+        )
 
 
 # --- Config Manager to handle YAML and Pydantic ---
 _config_manager_logger = logging.getLogger(__name__ + ".ConfigManager")
 
 
+@lru_cache(maxsize=1)
+def _build_settings() -> Settings:
+    """
+    Construct Settings once per process so .env and YAML are parsed a single time.
+    ConfigManager.reload() clears this cache.
+    """
+    try:
+        # A leaked system PATH is handled by ConnectionConfig's path validator
+        return Settings()
+    except Exception as e:
+        _config_manager_logger.error(
+            f"Error loading settings: {e}. Falling back to default settings."
+        )
+        # Build from field defaults alone: calling Settings() again would read
+        # the same sources and raise the same error
+        return Settings.model_construct()
+
+
 class ConfigManager:
     """
     Configuration manager that loads settings via Pydantic's BaseSettings.
@@ -479,50 +724,26 @@ class ConfigManager:
     """
 
     def __init__(self, config_path: Optional[Path] = None):
-        self.config_path = config_path or Path(__file__).parent / "config.yaml"
+        self.config_path = config_path or CONFIG_YAML_PATH
         self._settings: Optional[Settings] = None
 
     def get_settings(self) -> Settings:
         """
         Retrieves the application settings.
-        Settings are loaded (or reloaded) using Pydantic's built-in mechanisms
-        which consult environment variables and the configured YAML file.
+        Settings are built once per process by _build_settings(), which
+        consults environment variables and the configured YAML file.
         """
         if self._settings is None:
-            try:
-                # Force the database path from environment variable if set
-                db_path = os.getenv("DUCKDB_DATABASE_PATH")
-                if db_path:
-                    print(f"Using database path: {db_path}")
-
-                self._settings = Settings()
-
-                # Additional safety check for database path
-                actual_path = self._settings.database.connection.path
-                if ";" in str(actual_path) and str(actual_path).count(";") > 5:
-                    # Override with environment variable or default
-                    if db_path:
-                        self._settings.database.connection.path = Path(db_path)
-                    else:
-                        self._settings.database.connection.path = (
-                            PROJECT_ROOT / "data" / "mcp.duckdb"
-                        )
-                    print(
-                        f"WARNING  Overrode invalid database path to: {self._settings.database.connection.path}"
-                    )
-
-                _config_manager_logger.info(
-                    f"Settings successfully loaded via Pydantic (from .env and {self.config_path})."
-                )
+            self._settings = _build_settings()
+            # Lazy %-formatting: nothing is rendered unless a handler wants it
+            _config_manager_logger.info(
+                "Settings successfully loaded via Pydantic (from .env and %s).",
+                self.config_path,
+            )
+            if _config_manager_logger.isEnabledFor(logging.DEBUG):
                 _config_manager_logger.debug(
-                    f"Final database path: {self._settings.database.connection.path}"
-                )
-            except Exception as e:
-                _config_manager_logger.error(
-                    f"Error loading settings: {e}. Falling back to default settings."
+                    "Final database path: %s", self._settings.database.connection.path
                 )
-                # If loading fails, ensure we still have a Settings instance with defaults
-                self._settings = Settings()
         return self._settings
 
     def reload(self):
@@ -531,6 +752,7 @@ class ConfigManager:
         This clears the cached settings object.
         """
         self._settings = None
+        _build_settings.cache_clear()
         _config_manager_logger.info("Configuration marked for reload.")
 
 
@@ -574,5 +796,9 @@ def get_visualization_config() -> VisualizationConfig:
     return config_manager.get_settings().visualization
 
 
-# For backward compatibility, also expose the global settings instance
-settings = config_manager.get_settings()
+# For backward compatibility, also expose the global settings instance. It is
+# resolved on first access (PEP 562) rather than at import time.
+def __getattr__(name: str):
+    if name == "settings":
+        return config_manager.get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
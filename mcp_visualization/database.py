@@ -4,10 +4,11 @@ Database utilities for package installation
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 
+from mcp_visualization.database.sample_data import connect_for_bulk_load
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,63 +20,79 @@ def create_sample_database(db_path: str):
     db_path_obj.parent.mkdir(parents=True, exist_ok=True)
     
     # Connect to database
-    conn = duckdb.connect(db_path)
+    conn = connect_for_bulk_load(db_path)
     
     try:
-        # Generate sample sales data
-        np.random.seed(42)
-        start_date = datetime(2023, 1, 1)
-        dates = [start_date + timedelta(days=i) for i in range(365)]
+        # Sample data is built column-wise with one bulk draw per random column
+        rng = np.random.default_rng(42)
+        
+        # Generate sample sales data: one row per (day, region, product)
         regions = ["North", "South", "East", "West"]
         products = ["Product A", "Product B", "Product C", "Product D"]
+        n_days, n_regions, n_products = 365, len(regions), len(products)
+        n_rows = n_days * n_regions * n_products
         
-        sales_data = []
-        for i, date in enumerate(dates):
-            for region in regions:
-                for product in products:
-                    sales_data.append({
-                        "date": date.strftime("%Y-%m-%d"),
-                        "region": region,
-                        "product": product,
-                        "sales_amount": np.random.normal(1000, 200),
-                        "quantity": np.random.poisson(50),
-                        "customer_count": np.random.poisson(25),
-                    })
+        date_idx = np.repeat(np.arange(n_days), n_regions * n_products)
+        region_idx = np.tile(np.repeat(np.arange(n_regions), n_products), n_days)
+        product_idx = np.tile(np.arange(n_products), n_days * n_regions)
         
-        sales_df = pd.DataFrame(sales_data)
-        conn.execute("CREATE TABLE IF NOT EXISTS sales AS SELECT * FROM sales_df")
+        sales_df = pd.DataFrame({
+            "date": np.datetime64("2023-01-01") + date_idx,
+            "region": np.array(regions)[region_idx],
+            "product": np.array(products)[product_idx],
+            "sales_amount": rng.normal(1000, 200, n_rows),
+            "quantity": rng.poisson(50, n_rows),
+            "customer_count": rng.poisson(25, n_rows),
+        })
         
         # Generate sample customer data
-        customer_data = []
-        for i in range(1000):
-            customer_data.append({
-                "customer_id": f"C{i+1:04d}",
-                "age": np.random.randint(18, 80),
-                "gender": np.random.choice(["M", "F"]),
-                "segment": np.random.choice(["Premium", "Standard", "Basic"]),
-                "lifetime_value": np.random.exponential(2000),
-                "region": np.random.choice(regions),
-            })
-        
-        customers_df = pd.DataFrame(customer_data)
-        conn.execute("CREATE TABLE IF NOT EXISTS customers AS SELECT * FROM customers_df")
+        n_customers = 1000
+        customer_numbers = np.arange(1, n_customers + 1).astype(str)
+        customers_df = pd.DataFrame({
+            "customer_id": np.char.add("C", np.char.zfill(customer_numbers, 4)),
+            "age": rng.integers(18, 80, n_customers),
+            "gender": rng.choice(["M", "F"], n_customers),
+            "segment": rng.choice(["Premium", "Standard", "Basic"], n_customers),
+            "lifetime_value": rng.exponential(2000, n_customers),
+            "region": rng.choice(regions, n_customers),
+        })
         
         # Generate sample product data
         categories = ["Electronics", "Clothing", "Home", "Sports"]
-        products_data = []
-        for i in range(100):
-            products_data.append({
-                "product_id": f"P{i+1:04d}",
-                "product_name": f"Product {i+1}",
-                "category": np.random.choice(categories),
-                "price": np.random.uniform(10, 1000),
-                "cost": np.random.uniform(5, 500),
-                "weight": np.random.uniform(0.1, 10),
-                "rating": np.random.uniform(1, 5),
-            })
+        n_products_catalog = 100
+        product_numbers = np.arange(1, n_products_catalog + 1).astype(str)
+        products_df = pd.DataFrame({
+            "product_id": np.char.add("P", np.char.zfill(product_numbers, 4)),
+            "product_name": np.char.add("Product ", product_numbers),
+            "category": rng.choice(categories, n_products_catalog),
+            "price": rng.uniform(10, 1000, n_products_catalog),
+            "cost": rng.uniform(5, 500, n_products_catalog),
+            "weight": rng.uniform(0.1, 10, n_products_catalog),
+            "rating": rng.uniform(1, 5, n_products_catalog),
+        })
         
-        products_df = pd.DataFrame(products_data)
-        conn.execute("CREATE TABLE IF NOT EXISTS products AS SELECT * FROM products_df")
+        # Register the frames explicitly instead of relying on DuckDB's
+        # replacement scan of local variables, and create all three tables
+        # in one transaction
+        frames = {"sales": sales_df, "customers": customers_df, "products": products_df}
+        conn.begin()
+        try:
+            for table, frame in frames.items():
+                conn.register(f"{table}_df", frame)
+            # Store dates as DATE rather than VARCHAR or TIMESTAMP
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sales AS "
+                "SELECT * REPLACE (CAST(date AS DATE) AS date) FROM sales_df"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS customers AS SELECT * FROM customers_df")
+            conn.execute("CREATE TABLE IF NOT EXISTS products AS SELECT * FROM products_df")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            for table in frames:
+                conn.unregister(f"{table}_df")
         
         logger.info(f"Created sample database with 3 tables at {db_path}")
         
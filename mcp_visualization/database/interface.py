@@ -3,9 +3,13 @@ Unified database interface for MCP visualization
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, List, Dict, Any, Optional
 import pandas as pd
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class DatabaseInterface(ABC):
     """Abstract base class for database managers"""
@@ -35,6 +39,16 @@ class DatabaseInterface(ABC):
         """Execute SQL query and return results as DataFrame"""
         pass
     
+    def execute_query_arrow(self, query: str, limit: int = 1000) -> "pa.Table":
+        """
+        Execute SQL query and return results as an Arrow table.
+
+        Requires pyarrow (the `arrow` extra). This default converts the
+        execute_query() DataFrame; backends with native Arrow output override it.
+        """
+        import pyarrow as pa
+        return pa.Table.from_pandas(self.execute_query(query, limit), preserve_index=False)
+    
     @abstractmethod
     def get_sample_data(self, table_name: str, limit: int = 10) -> pd.DataFrame:
         """Get sample data from a table"""
@@ -51,20 +65,36 @@ class DatabaseInterface(ABC):
         pass
 
 
+@lru_cache(maxsize=1)
+def _duckdb_manager_cls():
+    """DuckDB manager class, imported on first use"""
+    from .manager import DatabaseManager
+    return DatabaseManager
+
+
+@lru_cache(maxsize=1)
+def _databricks_manager_cls():
+    """Databricks manager class, imported only when Databricks is used"""
+    from ..databricks_integration.manager import DatabricksManager
+    return DatabricksManager
+
+
 class DatabaseFactory:
     """Factory for creating database managers"""
     
+    # Result of detect_database_type; credentials are read once per process
+    _detected: ClassVar[Optional[str]] = None
+    
     @staticmethod
     def create_manager(db_type: str, **kwargs) -> DatabaseInterface:
         """Create appropriate database manager based on type"""
         
-        if db_type.lower() == 'duckdb':
-            from .manager import DatabaseManager
-            return DatabaseManager(**kwargs)
+        normalized = db_type.lower()
+        if normalized == 'duckdb':
+            return _duckdb_manager_cls()(**kwargs)
         
-        elif db_type.lower() == 'databricks':
-            from ..databricks_integration.manager import DatabricksManager
-            return DatabricksManager(**kwargs)
+        elif normalized == 'databricks':
+            return _databricks_manager_cls()(**kwargs)
         
         else:
             raise ValueError(f"Unsupported database type: {db_type}")
@@ -72,15 +102,20 @@ class DatabaseFactory:
     @staticmethod
     def detect_database_type(connection_string: str = None, **kwargs) -> str:
         """Detect database type from connection parameters"""
+        if DatabaseFactory._detected is not None:
+            return DatabaseFactory._detected
+        
+        # Default to DuckDB
+        detected = 'duckdb'
         
         # Check for Databricks credentials
         try:
             from ..databricks_integration.credentials import DatabricksCredentialManager
             cred_manager = DatabricksCredentialManager()
             if cred_manager.load_credentials():
-                return 'databricks'
+                detected = 'databricks'
         except:
             pass
         
-        # Default to DuckDB
-        return 'duckdb'
\ No newline at end of file
+        DatabaseFactory._detected = detected
+        return detected
\ No newline at end of file
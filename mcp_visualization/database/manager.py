@@ -3,12 +3,17 @@ Database manager for DuckDB operations
 """
 
 import logging
+import queue
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Optional, Tuple
 import duckdb
 import pandas as pd
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 # Import the settings and config functions properly
 from ..config.settings import (
     get_server_config,
@@ -26,6 +31,13 @@ from .interface import DatabaseInterface
 
 logger = logging.getLogger(__name__)
 
+# DuckDB type names that get numeric column statistics
+NUMERIC_TYPES = ("INTEGER", "BIGINT", "DOUBLE", "FLOAT", "DECIMAL", "NUMERIC")
+
+# Columns with more distinct values than this get no top values when several
+# columns are profiled together; grouping them costs a scan each for little use
+TOP_VALUES_MAX_DISTINCT = 1000
+
 
 class DatabaseManager(DatabaseInterface):
     def __init__(self, db_path: Optional[Path] = None):
@@ -37,6 +49,11 @@ class DatabaseManager(DatabaseInterface):
 
         # Ensure db_path is a Path object, using the default if not provided
         self.db_path = db_path if db_path else self.config.connection.path
+        # Cursors duplicated from self.connection, one checked out per query
+        self._pool: Optional[queue.Queue] = None
+        self.query_builder = QueryBuilder()
+        # DESCRIBE results per table; cleared whenever this manager changes the schema
+        self._columns_cache: Dict[str, List[Dict[str, str]]] = {}
         logger.info(f"Attempting to connect to database at: {self.db_path}")
         self.connect()
 
@@ -209,6 +226,7 @@ class DatabaseManager(DatabaseInterface):
                     )
 
             self.connection = connect_with_timeout()
+            self._init_pool()
             print(f"DuckDB connection established successfully", file=sys.stderr)
             logger.info(f"Successfully connected to DuckDB at: {self.db_path}")
             return True
@@ -223,13 +241,68 @@ class DatabaseManager(DatabaseInterface):
             self.connect()
         return self.connection
 
-    def execute_query(self, query: str, limit: int = 1000) -> pd.DataFrame:
-        """Execute SQL query and return results as DataFrame (interface method)"""
-        # Add LIMIT if not present and limit is specified
+    def _init_pool(self):
+        """Seed the cursor pool from the freshly opened connection"""
+        self._close_pool()
+        pool_size = self.config.settings.pool_size
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            # cursor() duplicates the connection onto the same database instance
+            self._pool.put(self.connection.cursor())
+
+    def _close_pool(self):
+        """Close every pooled cursor"""
+        if self._pool is None:
+            return
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+        self._pool = None
+
+    @contextmanager
+    def _checkout(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Borrow a pooled cursor for one query, so independent queries from
+        different threads run concurrently instead of serializing on
+        self.connection. Blocks while every cursor is in use.
+        """
+        pool = self._pool
+        if pool is None:
+            yield self.connection
+            return
+        cursor = pool.get()
+        try:
+            yield cursor
+        finally:
+            pool.put(cursor)
+
+    @staticmethod
+    def _apply_limit(query: str, limit: int) -> str:
+        """Add LIMIT if not present and limit is specified, so DuckDB caps the rows"""
         if limit and "LIMIT" not in query.upper():
             query = f"{query.rstrip(';')} LIMIT {limit}"
+        return query
 
-        return self.execute_query_with_params(query)
+    def execute_query(self, query: str, limit: int = 1000) -> pd.DataFrame:
+        """Execute SQL query and return results as DataFrame (interface method)"""
+        return self.execute_query_with_params(self._apply_limit(query, limit))
+
+    def execute_query_arrow(self, query: str, limit: int = 1000) -> "pa.Table":
+        """Execute SQL query and return DuckDB's native Arrow result, skipping pandas"""
+        sql = self._apply_limit(query, limit)
+        try:
+            # Validate SQL query for security
+            if not validate_sql_query(sql, self.security_config):
+                raise ValueError("SQL query contains forbidden keywords or patterns")
+
+            logger.debug(f"Executing query (arrow): {sql}")
+            with self._checkout() as cursor:
+                result = cursor.execute(sql).fetch_arrow_table()
+            logger.debug(f"Query returned {result.num_rows} rows")
+            return result
+        except Exception as e:
+            logger.error(f"Error executing query: {e}")
+            logger.error(f"Query: {sql}")
+            raise
 
     def execute_query_with_params(
         self, sql: str, params: Optional[Dict[str, Any]] = None
@@ -242,10 +315,11 @@ class DatabaseManager(DatabaseInterface):
 
             logger.debug(f"Executing query: {sql}")
 
-            if params:
-                result = self.connection.execute(sql, params).df()
-            else:
-                result = self.connection.execute(sql).df()
+            with self._checkout() as cursor:
+                if params:
+                    result = cursor.execute(sql, params).df()
+                else:
+                    result = cursor.execute(sql).df()
 
             logger.debug(f"Query returned {len(result)} rows")
             return result
@@ -258,14 +332,15 @@ class DatabaseManager(DatabaseInterface):
     def get_tables(self) -> List[Dict[str, str]]:
         """Get list of available tables with metadata"""
         try:
-            result = self.connection.execute(
-                """
-                SELECT table_name, table_type 
-                FROM information_schema.tables 
-                WHERE table_schema = 'main'
-                ORDER BY table_name
-                """
-            ).fetchall()
+            with self._checkout() as cursor:
+                result = cursor.execute(
+                    """
+                    SELECT table_name, table_type 
+                    FROM information_schema.tables 
+                    WHERE table_schema = 'main'
+                    ORDER BY table_name
+                    """
+                ).fetchall()
 
             return [{"name": row[0], "type": row[1]} for row in result]
 
@@ -279,22 +354,26 @@ class DatabaseManager(DatabaseInterface):
             # Get column information
             columns = self.get_columns(table_name)
 
-            # Get row count
-            row_count_result = self.connection.execute(
-                f"SELECT COUNT(*) FROM {table_name}"
-            ).fetchone()
-            row_count = row_count_result[0] if row_count_result else 0
+            with self._checkout() as cursor:
+                # Get row count
+                row_count_result = cursor.execute(
+                    f"SELECT COUNT(*) FROM {table_name}"
+                ).fetchone()
+                row_count = row_count_result[0] if row_count_result else 0
 
-            # Get sample data
-            sample_data = self.connection.execute(
-                f"SELECT * FROM {table_name} LIMIT 5"
-            ).df()
+                # Get sample data as plain rows; five records do not need a
+                # pandas round trip
+                sample_result = cursor.execute(f"SELECT * FROM {table_name} LIMIT 5")
+                sample_columns = [desc[0] for desc in sample_result.description]
+                sample_data = [
+                    dict(zip(sample_columns, row)) for row in sample_result.fetchall()
+                ]
 
             return {
                 "name": table_name,
                 "columns": columns,
                 "row_count": row_count,
-                "sample_data": sample_data.to_dict("records"),
+                "sample_data": sample_data,
             }
 
         except Exception as e:
@@ -303,9 +382,14 @@ class DatabaseManager(DatabaseInterface):
 
     def get_columns(self, table_name: str) -> List[Dict[str, str]]:
         """Get column information for a table"""
+        cached = self._columns_cache.get(table_name)
+        if cached is not None:
+            return list(cached)
+
         try:
-            result = self.connection.execute(f"DESCRIBE {table_name}").fetchall()
-            return [
+            with self._checkout() as cursor:
+                result = cursor.execute(f"DESCRIBE {table_name}").fetchall()
+            columns = [
                 {
                     "name": row[0],
                     "type": row[1],
@@ -313,15 +397,75 @@ class DatabaseManager(DatabaseInterface):
                 }
                 for row in result
             ]
+            self._columns_cache[table_name] = columns
+            return list(columns)
 
         except Exception as e:
             logger.error(f"Error getting columns for {table_name}: {e}")
             return []
 
+    def _profile_columns(
+        self,
+        table_name: str,
+        columns: List[Dict[str, str]],
+        max_distinct: Optional[int] = TOP_VALUES_MAX_DISTINCT,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute get_column_stats() results for several columns.
+
+        Counts and numeric stats come from one scan. Top values are then
+        fetched in a second query, only for columns with at most
+        `max_distinct` distinct values (all columns when None); the rest
+        get an empty list.
+        """
+        specs = [
+            (col["name"], any(t in col["type"].upper() for t in NUMERIC_TYPES))
+            for col in columns
+        ]
+        query = self.query_builder.build_column_profile_query(table_name, specs)
+        with self._checkout() as cursor:
+            row = cursor.execute(query).fetchone()
+
+        total_count = row[0]
+        values = iter(row[1:])
+        profiles = {}
+        for col_name, is_numeric in specs:
+            non_null_count = next(values)
+            stats = {
+                "total_count": total_count,
+                "non_null_count": non_null_count,
+                "distinct_count": next(values),
+                "null_count": total_count - non_null_count,
+            }
+            if is_numeric:
+                for key in (
+                    "min_value",
+                    "max_value",
+                    "mean_value",
+                    "median_value",
+                    "std_value",
+                ):
+                    stats[key] = next(values)
+            stats["top_values"] = []
+            profiles[col_name] = stats
+
+        top_columns = [
+            col_name
+            for col_name, stats in profiles.items()
+            if stats["non_null_count"]
+            and (max_distinct is None or stats["distinct_count"] <= max_distinct)
+        ]
+        if top_columns:
+            query = self.query_builder.build_top_values_query(table_name, top_columns)
+            with self._checkout() as cursor:
+                row = cursor.execute(query).fetchone()
+            for col_name, top_values in zip(top_columns, row):
+                profiles[col_name]["top_values"] = top_values or []
+        return profiles
+
     def get_column_stats(self, table_name: str, column_name: str) -> Dict[str, Any]:
         """Get statistical information for a column"""
         try:
-            # Check if column is numeric
             columns = self.get_columns(table_name)
             column_info = next(
                 (col for col in columns if col["name"] == column_name), None
@@ -330,76 +474,10 @@ class DatabaseManager(DatabaseInterface):
             if not column_info:
                 return {"error": f"Column {column_name} not found"}
 
-            column_type = column_info["type"].upper()
-            is_numeric = any(
-                t in column_type
-                for t in ["INTEGER", "BIGINT", "DOUBLE", "FLOAT", "DECIMAL", "NUMERIC"]
-            )
-
-            stats = {}
-
-            # Basic stats for all columns
-            basic_stats = self.connection.execute(
-                f"""
-                SELECT 
-                    COUNT(*) as total_count,
-                    COUNT({column_name}) as non_null_count,
-                    COUNT(DISTINCT {column_name}) as distinct_count
-                FROM {table_name}
-            """
-            ).fetchone()
-
-            stats.update(
-                {
-                    "total_count": basic_stats[0],
-                    "non_null_count": basic_stats[1],
-                    "distinct_count": basic_stats[2],
-                    "null_count": basic_stats[0] - basic_stats[1],
-                }
-            )
-
-            # Numeric stats
-            if is_numeric:
-                numeric_stats = self.connection.execute(
-                    f"""
-                    SELECT 
-                        MIN({column_name}) as min_value,
-                        MAX({column_name}) as max_value,
-                        AVG({column_name}) as mean_value,
-                        MEDIAN({column_name}) as median_value,
-                        STDDEV({column_name}) as std_value
-                    FROM {table_name}
-                    WHERE {column_name} IS NOT NULL
-                """
-                ).fetchone()
-
-                stats.update(
-                    {
-                        "min_value": numeric_stats[0],
-                        "max_value": numeric_stats[1],
-                        "mean_value": numeric_stats[2],
-                        "median_value": numeric_stats[3],
-                        "std_value": numeric_stats[4],
-                    }
-                )
-
-            # Top values
-            top_values = self.connection.execute(
-                f"""
-                SELECT {column_name}, COUNT(*) as count
-                FROM {table_name}
-                WHERE {column_name} IS NOT NULL
-                GROUP BY {column_name}
-                ORDER BY count DESC
-                LIMIT 10
-            """
-            ).fetchall()
-
-            stats["top_values"] = [
-                {"value": row[0], "count": row[1]} for row in top_values
-            ]
-
-            return stats
+            # A single column always gets its top values, whatever its cardinality
+            return self._profile_columns(
+                table_name, [column_info], max_distinct=None
+            )[column_name]
 
         except Exception as e:
             logger.error(
@@ -407,6 +485,10 @@ class DatabaseManager(DatabaseInterface):
             )
             return {"error": str(e)}
 
+    def _invalidate_schema(self):
+        """Forget cached DESCRIBE results after a schema change"""
+        self._columns_cache.clear()
+
     def load_csv(self, file_path: str, table_name: str, **kwargs) -> Dict[str, Any]:
         """Load CSV file into database"""
         try:
@@ -422,12 +504,14 @@ class DatabaseManager(DatabaseInterface):
                 raise FileNotFoundError(f"File not found: {file_path}")
 
             # Load CSV with auto-detection
-            self.connection.execute(
-                f"""
-                CREATE TABLE {table_name} AS 
-                SELECT * FROM read_csv_auto('{file_path_obj}')
-            """
-            )
+            with self._checkout() as cursor:
+                cursor.execute(
+                    f"""
+                    CREATE TABLE {table_name} AS 
+                    SELECT * FROM read_csv_auto('{file_path_obj}')
+                """
+                )
+            self._invalidate_schema()
 
             # Get table info
             table_info = self.get_table_info(table_name)
@@ -461,7 +545,9 @@ class DatabaseManager(DatabaseInterface):
             if not validate_sql_query(sql, self.security_config):
                 raise ValueError("SQL query contains forbidden keywords or patterns")
 
-            self.connection.execute(f"CREATE VIEW {view_name} AS {sql}")
+            with self._checkout() as cursor:
+                cursor.execute(f"CREATE VIEW {view_name} AS {sql}")
+            self._invalidate_schema()
             logger.info(f"Created view: {view_name}")
             return True
 
@@ -476,7 +562,9 @@ class DatabaseManager(DatabaseInterface):
                 logger.warning(f"DROP operations not allowed")
                 return False
 
-            self.connection.execute(f"DROP TABLE IF EXISTS {table_name}")
+            with self._checkout() as cursor:
+                cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+            self._invalidate_schema()
             logger.info(f"Dropped table: {table_name}")
             return True
 
@@ -495,6 +583,15 @@ class DatabaseManager(DatabaseInterface):
                 "suggested_charts": [],
             }
 
+            # Stats for every column from one fused scan, top values only for
+            # low-cardinality columns; fall back to per-column queries if it
+            # fails (e.g. an unsupported type)
+            try:
+                profiles = self._profile_columns(table_name, columns)
+            except Exception as e:
+                logger.warning(f"Fused column profiling failed for {table_name}: {e}")
+                profiles = {}
+
             # Analyze each column
             for col in columns:
                 col_name = col["name"]
@@ -513,7 +610,9 @@ class DatabaseManager(DatabaseInterface):
                 }
 
                 # Get basic stats
-                stats = self.get_column_stats(table_name, col_name)
+                stats = profiles.get(col_name) or self.get_column_stats(
+                    table_name, col_name
+                )
                 col_analysis.update(stats)
 
                 analysis["column_analysis"][col_name] = col_analysis
@@ -626,6 +725,7 @@ class DatabaseManager(DatabaseInterface):
 
     def close(self):
         """Close database connection"""
+        self._close_pool()
         if self.connection:
             self.connection.close()
             self.connection = None
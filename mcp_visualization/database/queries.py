@@ -372,6 +372,59 @@ class QueryBuilder:
 
         return " UNION ALL ".join(union_queries)
 
+    def build_column_profile_query(
+        self, table_name: str, columns: List[Tuple[str, bool]]
+    ) -> str:
+        """
+        Build one query profiling every given (column, is_numeric) pair.
+
+        The single result row holds COUNT(*) followed, per column, by the
+        non-null count, distinct count and MIN/MAX/AVG/MEDIAN/STDDEV
+        (numeric columns only), all computed in one pass over the table.
+        """
+        safe_table = self._sanitize_table_name(table_name)
+        select_parts = ["COUNT(*)"]
+        for col, is_numeric in columns:
+            safe_col = self._sanitize_column_name(col)
+            select_parts.extend(
+                [f"COUNT({safe_col})", f"COUNT(DISTINCT {safe_col})"]
+            )
+            if is_numeric:
+                select_parts.extend(
+                    [
+                        f"MIN({safe_col})",
+                        f"MAX({safe_col})",
+                        f"AVG({safe_col})",
+                        f"MEDIAN({safe_col})",
+                        f"STDDEV({safe_col})",
+                    ]
+                )
+
+        return f"SELECT {', '.join(select_parts)} FROM {safe_table}"
+
+    def build_top_values_query(
+        self, table_name: str, columns: List[str], limit: int = 10
+    ) -> str:
+        """
+        Build one query returning the most frequent values of each column.
+
+        The single result row holds, per column, a list of up to `limit`
+        {value, count} structs. Each column is grouped by its own scalar
+        subquery, so callers should pass only the columns worth grouping.
+        """
+        safe_table = self._sanitize_table_name(table_name)
+        select_parts = []
+        for col in columns:
+            safe_col = self._sanitize_column_name(col)
+            select_parts.append(
+                f"(SELECT list({{'value': v, 'count': n}} ORDER BY n DESC) FROM "
+                f"(SELECT {safe_col} AS v, COUNT(*) AS n FROM {safe_table} "
+                f"WHERE {safe_col} IS NOT NULL GROUP BY {safe_col} "
+                f"ORDER BY n DESC LIMIT {int(limit)}))"
+            )
+
+        return f"SELECT {', '.join(select_parts)}"
+
     def _build_filter_condition(self, filter_obj: QueryFilter) -> str:
         """Build a single filter condition"""
         try:
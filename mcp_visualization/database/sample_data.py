@@ -1,6 +1,7 @@
 """Sample database creation utilities"""
 
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Optional
@@ -8,6 +9,27 @@ import duckdb
 
 logger = logging.getLogger(__name__)
 
+# Tables populated by create_sample_database
+SAMPLE_TABLES = frozenset({"sales_data", "employee_data", "weather_data"})
+
+# Connection settings for the one-off bulk load: use every core and skip
+# insertion-order bookkeeping, which the sample tables do not rely on
+BULK_LOAD_CONFIG = {
+    "threads": os.cpu_count() or 1,
+    "memory_limit": "1GB",
+    "preserve_insertion_order": False,
+}
+
+
+def connect_for_bulk_load(db_path: str) -> duckdb.DuckDBPyConnection:
+    """Open db_path with BULK_LOAD_CONFIG, falling back to default settings"""
+    try:
+        return duckdb.connect(db_path, config=BULK_LOAD_CONFIG)
+    except duckdb.Error as config_error:
+        # Older DuckDB builds may reject some settings
+        logger.warning(f"Bulk-load settings rejected, using defaults: {config_error}")
+        return duckdb.connect(db_path)
+
 
 def create_sample_database(db_path: Optional[str] = None) -> str:
     """
@@ -37,10 +59,19 @@ def create_sample_database(db_path: Optional[str] = None) -> str:
         if db_file.exists():
             print(f"INFO Database file already exists, checking if accessible...")
             try:
-                # Quick test connection
+                # Quick test connection, also reporting which tables are present
                 test_conn = duckdb.connect(db_path)
-                test_conn.close()
+                try:
+                    existing_tables = {row[0] for row in test_conn.execute("SHOW TABLES").fetchall()}
+                finally:
+                    test_conn.close()
                 print(f"SUCCESS Database file is accessible")
+                
+                # Nothing to do if a previous run already populated the sample tables
+                if db_file.stat().st_size > 0 and SAMPLE_TABLES <= existing_tables:
+                    print(f"SKIP Sample tables already present, skipping creation")
+                    logger.info(f"Sample database already populated at: {db_path}")
+                    return db_path
             except Exception as e:
                 print(f"WARNING Database file exists but may be locked: {e}")
                 # Try to use a different path
@@ -59,7 +90,7 @@ def create_sample_database(db_path: Optional[str] = None) -> str:
             
             def db_worker():
                 try:
-                    conn = duckdb.connect(db_path)
+                    conn = connect_for_bulk_load(db_path)
                     result_queue.put(("success", conn))
                 except Exception as e:
                     result_queue.put(("error", e))
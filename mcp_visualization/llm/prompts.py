@@ -8,7 +8,7 @@ from typing import Dict, List, Any, Optional
 import json
 
 # SUCCESS Import the LLMPromptsConfig type
-from config.settings import LLMPromptsConfig
+from config.settings import LLMPromptsConfig, compile_template
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,8 @@ class PromptManager:
             "data_quality_check": self.prompts_config.data_quality_check_template,
             "followup_questions": self.prompts_config.followup_questions_template,
         }
+        # Pre-parsed renderers, kept in step with self.templates
+        self._renderers = dict(self.prompts_config.compiled_templates)
         logger.info("PromptManager initialized with templates from configuration.")
 
     def get_chart_type_detection_prompt(
@@ -34,7 +36,7 @@ class PromptManager:
     ) -> str:
         """Get prompt for chart type detection"""
         columns_str = ", ".join(columns)
-        return self.templates["chart_type_detection"].format(
+        return self._renderers["chart_type_detection"](
             request=request, table_name=table_name, columns=columns_str
         )
 
@@ -47,7 +49,7 @@ class PromptManager:
             columns_info.append(f"{col['name']} ({col['type']})")
 
         columns_str = ", ".join(columns_info)
-        return self.templates["column_suggestion"].format(
+        return self._renderers["column_suggestion"](
             chart_type=chart_type, columns=columns_str, request=request
         )
 
@@ -55,7 +57,7 @@ class PromptManager:
         self, chart_type: str, data_summary: Dict[str, Any], insights: Dict[str, Any]
     ) -> str:
         """Get prompt for insights description"""
-        return self.templates["insights_description"].format(
+        return self._renderers["insights_description"](
             chart_type=chart_type,
             data_summary=json.dumps(data_summary, indent=2),
             insights=json.dumps(insights, indent=2),
@@ -71,7 +73,7 @@ class PromptManager:
         # Limit data preview for prompt
         preview = data_preview[:5] if len(data_preview) > 5 else data_preview
 
-        return self.templates["chart_explanation"].format(
+        return self._renderers["chart_explanation"](
             chart_type=chart_type,
             column_mappings=json.dumps(column_mappings, indent=2),
             data_preview=json.dumps(preview, indent=2),
@@ -84,7 +86,7 @@ class PromptManager:
         basic_stats: Dict[str, Any],
     ) -> str:
         """Get prompt for data quality analysis"""
-        return self.templates["data_quality_check"].format(
+        return self._renderers["data_quality_check"](
             columns=json.dumps(columns, indent=2),
             sample_data=json.dumps(sample_data[:10], indent=2),  # Limit sample size
             basic_stats=json.dumps(basic_stats, indent=2),
@@ -98,7 +100,7 @@ class PromptManager:
         available_columns: List[str],
     ) -> str:
         """Get prompt for generating follow-up questions"""
-        return self.templates["followup_questions"].format(
+        return self._renderers["followup_questions"](
             chart_type=chart_type,
             chart_context=chart_context,
             insights=json.dumps(insights, indent=2),
@@ -111,6 +113,7 @@ class PromptManager:
         # For now, it will only update the in-memory templates dict.
         # Consider if you want this to persist or just be for runtime.
         self.templates[template_name] = custom_template
+        self._renderers[template_name] = compile_template(custom_template)
         logger.info(f"Updated prompt template: {template_name}")
 
     def get_template(self, template_name: str) -> Optional[str]:
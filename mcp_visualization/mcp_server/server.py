@@ -201,9 +201,8 @@ class DataVisualizationMCPServer:
 
             import pandas as pd
             import numpy as np
-            from datetime import datetime, timedelta
 
-            np.random.seed(42)
+            rng = np.random.default_rng(42)
 
             # Loop through configured sample datasets
             # SUCCESS Access the datasets from the settings object
@@ -218,59 +217,58 @@ class DataVisualizationMCPServer:
                 # Generate DataFrame based on table_name as per your original logic
                 df_to_load = None
                 if table_name == "sales":
-                    start_date = datetime(2023, 1, 1)
-                    dates = [start_date + timedelta(days=i) for i in range(365)]
+                    # One row per (day, region, product), built column-wise
                     regions = ["North", "South", "East", "West"]
                     products = ["Product A", "Product B", "Product C", "Product D"]
-                    sales_data = []
-                    for i, date in enumerate(dates):
-                        for region in regions:
-                            for product in products:
-                                sales_data.append(
-                                    {
-                                        "date": date.strftime("%Y-%m-%d"),
-                                        "region": region,
-                                        "product": product,
-                                        "sales_amount": np.random.normal(1000, 200),
-                                        "quantity": np.random.poisson(50),
-                                        "customer_count": np.random.poisson(25),
-                                    }
-                                )
-                    df_to_load = pd.DataFrame(sales_data)
+                    n_days, n_regions, n_products = 365, len(regions), len(products)
+                    n_rows = n_days * n_regions * n_products
+                    date_idx = np.repeat(np.arange(n_days), n_regions * n_products)
+                    region_idx = np.tile(
+                        np.repeat(np.arange(n_regions), n_products), n_days
+                    )
+                    product_idx = np.tile(np.arange(n_products), n_days * n_regions)
+                    df_to_load = pd.DataFrame(
+                        {
+                            "date": np.datetime64("2023-01-01") + date_idx,
+                            "region": np.array(regions)[region_idx],
+                            "product": np.array(products)[product_idx],
+                            "sales_amount": rng.normal(1000, 200, n_rows),
+                            "quantity": rng.poisson(50, n_rows),
+                            "customer_count": rng.poisson(25, n_rows),
+                        }
+                    )
                 elif table_name == "customers":
                     regions = ["North", "South", "East", "West"]
-                    customer_data = []
-                    for i in range(1000):
-                        customer_data.append(
-                            {
-                                "customer_id": f"C{i+1:04d}",
-                                "age": np.random.randint(18, 80),
-                                "gender": np.random.choice(["M", "F"]),
-                                "segment": np.random.choice(
-                                    ["Premium", "Standard", "Basic"]
-                                ),
-                                "lifetime_value": np.random.exponential(2000),
-                                "region": np.random.choice(regions),
-                            }
-                        )
-                    df_to_load = pd.DataFrame(customer_data)
+                    n_rows = 1000
+                    ids = np.arange(1, n_rows + 1).astype(str)
+                    df_to_load = pd.DataFrame(
+                        {
+                            "customer_id": np.char.add("C", np.char.zfill(ids, 4)),
+                            "age": rng.integers(18, 80, n_rows),
+                            "gender": rng.choice(["M", "F"], n_rows),
+                            "segment": rng.choice(
+                                ["Premium", "Standard", "Basic"], n_rows
+                            ),
+                            "lifetime_value": rng.exponential(2000, n_rows),
+                            "region": rng.choice(regions, n_rows),
+                        }
+                    )
                 elif table_name == "products":
                     # SUCCESS ADDED: Products sample data generation
                     categories = ["Electronics", "Clothing", "Home", "Sports"]
-                    products_data = []
-                    for i in range(100):
-                        products_data.append(
-                            {
-                                "product_id": f"P{i+1:04d}",
-                                "product_name": f"Product {i+1}",
-                                "category": np.random.choice(categories),
-                                "price": np.random.uniform(10, 1000),
-                                "cost": np.random.uniform(5, 500),
-                                "weight": np.random.uniform(0.1, 10),
-                                "rating": np.random.uniform(1, 5),
-                            }
-                        )
-                    df_to_load = pd.DataFrame(products_data)
+                    n_rows = 100
+                    ids = np.arange(1, n_rows + 1).astype(str)
+                    df_to_load = pd.DataFrame(
+                        {
+                            "product_id": np.char.add("P", np.char.zfill(ids, 4)),
+                            "product_name": np.char.add("Product ", ids),
+                            "category": rng.choice(categories, n_rows),
+                            "price": rng.uniform(10, 1000, n_rows),
+                            "cost": rng.uniform(5, 500, n_rows),
+                            "weight": rng.uniform(0.1, 10, n_rows),
+                            "rating": rng.uniform(1, 5, n_rows),
+                        }
+                    )
 
                 if df_to_load is not None:
                     # Save to CSV (optional, if you want to persist the generated data)
@@ -4,12 +4,40 @@ MCP tool definitions and registry
 """
 
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from pathlib import Path
 from mcp.types import Tool, TextContent
 
 logger = logging.getLogger(__name__)
 
+# Tool groupings used by get_tool_help when listing all tools
+_TOOL_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "Data Management": (
+        "list_tables",
+        "analyze_table",
+        "load_csv_data",
+        "query_data",
+        "get_column_stats",
+    ),
+    "Visualization": (
+        "create_visualization",
+        "configure_chart",
+        "suggest_visualizations",
+        "validate_chart_config",
+    ),
+    "Database Management": (
+        "change_database",
+        "browse_databases",
+        "browse_downloads_databases",
+        "list_recent_databases",
+    ),
+    "Utilities": (
+        "create_sample_chart",
+        "explain_chart_types",
+        "server_status",
+    ),
+}
+
 
 class ToolRegistry:
     """Registry for MCP tools"""
@@ -22,6 +50,24 @@ class ToolRegistry:
         # Define all available tools
         self.tools = self._define_tools()
 
+        # Pre-compile argument constraints once so validation is a set lookup
+        self._tool_constraints = self._compile_tool_constraints(self.tools)
+
+    @staticmethod
+    def _compile_tool_constraints(tools: List[Tool]) -> Dict[str, Dict[str, Any]]:
+        """Build required/allowed argument sets for each tool schema"""
+        constraints = {}
+        for tool in tools:
+            schema = tool.inputSchema
+            allowed = None
+            if not schema.get("additionalProperties", True):
+                allowed = frozenset(schema.get("properties", {}))
+            constraints[tool.name] = {
+                "required": tuple(schema.get("required", ())),
+                "allowed": allowed,
+            }
+        return constraints
+
     def _define_tools(self) -> List[Tool]:
         """Define all MCP tools - always provide full tool set, let handlers manage database requirements"""
         
@@ -723,11 +769,12 @@ class ToolRegistry:
     ) -> Dict[str, Any]:
         """Validate tool arguments against schema"""
         try:
-            tool = self.get_tool_by_name(tool_name)
+            constraints = self._tool_constraints.get(tool_name)
+            if constraints is None:
+                raise ValueError(f"Tool not found: {tool_name}")
 
             # Basic validation - check required fields
-            required_fields = tool.inputSchema.get("required", [])
-            for field in required_fields:
+            for field in constraints["required"]:
                 if field not in arguments:
                     return {
                         "valid": False,
@@ -735,10 +782,9 @@ class ToolRegistry:
                     }
 
             # Check for unexpected fields if additionalProperties is False
-            if not tool.inputSchema.get("additionalProperties", True):
-                allowed_fields = set(tool.inputSchema.get("properties", {}).keys())
-                provided_fields = set(arguments.keys())
-                unexpected_fields = provided_fields - allowed_fields
+            allowed_fields = constraints["allowed"]
+            if allowed_fields is not None:
+                unexpected_fields = arguments.keys() - allowed_fields
 
                 if unexpected_fields:
                     return {
@@ -791,34 +837,7 @@ class ToolRegistry:
             help_text = "# Available Tools\n\n"
 
             # Group tools by category
-            categories = {
-                "Data Management": [
-                    "list_tables",
-                    "analyze_table",
-                    "load_csv_data",
-                    "query_data",
-                    "get_column_stats",
-                ],
-                "Visualization": [
-                    "create_visualization",
-                    "configure_chart",
-                    "suggest_visualizations",
-                    "validate_chart_config",
-                ],
-                "Database Management": [
-                    "change_database",
-                    "browse_databases",
-                    "browse_downloads_databases",
-                    "list_recent_databases",
-                ],
-                "Utilities": [
-                    "create_sample_chart",
-                    "explain_chart_types",
-                    "server_status",
-                ],
-            }
-
-            for category, tool_names in categories.items():
+            for category, tool_names in _TOOL_CATEGORIES.items():
                 help_text += f"## {category}\n\n"
                 for tool_name in tool_names:
                     try:
@@ -48,9 +48,10 @@ def validate_sql_query(query: str, security_config: SecurityConfig) -> bool:
             if token.ttype is Keyword or token.ttype is DML:
                 keywords.append(token.value.upper())
 
-        # Check for blocked keywords
+        # Check for blocked keywords (the config holds upper-cased frozensets)
+        blocked_keywords = security_config.blocked_sql_keywords
         for keyword in keywords:
-            if keyword in [k.upper() for k in security_config.blocked_sql_keywords]:
+            if keyword in blocked_keywords:
                 logger.warning(f"Blocked SQL keyword found: {keyword}")
                 return False
 
@@ -61,9 +62,7 @@ def validate_sql_query(query: str, security_config: SecurityConfig) -> bool:
                 first_keyword = token.value.upper()
                 break
 
-        if first_keyword and first_keyword not in [
-            k.upper() for k in security_config.allowed_sql_keywords
-        ]:
+        if first_keyword and first_keyword not in security_config.allowed_sql_keywords:
             logger.warning(f"Query starts with disallowed keyword: {first_keyword}")
             return False
 
@@ -424,14 +424,15 @@ class ChartGenerator:
     def create_sample_chart(self, chart_type: ChartType = ChartType.BAR) -> str:
         """Create a sample chart for testing"""
         try:
-            # Generate sample data
-            np.random.seed(42)
+            # Generate sample data with a local generator, leaving the
+            # global NumPy random state untouched
+            rng = np.random.default_rng(42)
             sample_data = {
                 "categories": ["A", "B", "C", "D", "E"] * 20,
-                "values": np.random.randint(10, 100, 100),
-                "values2": np.random.randint(5, 50, 100),
+                "values": rng.integers(10, 100, 100),
+                "values2": rng.integers(5, 50, 100),
                 "dates": pd.date_range("2023-01-01", periods=100),
-                "groups": np.random.choice(["Group1", "Group2", "Group3"], 100),
+                "groups": rng.choice(["Group1", "Group2", "Group3"], 100),
             }
 
             df = pd.DataFrame(sample_data)
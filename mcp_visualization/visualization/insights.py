@@ -468,12 +468,12 @@ class InsightsCalculator:
             return int(value)
 
         if isinstance(value, (float, np.floating)):
+            formatting = self.config.formatting
             if abs(value) >= 1e6:
-                return f"{value:.2e}"  # Scientific notation for large numbers
+                # Scientific notation for large numbers
+                return formatting.format_large_number(value)
             else:
-                return round(
-                    value, self.config.formatting.decimal_places
-                )  # Use new config path
+                return formatting.format_decimal(value)
 
         return value
 
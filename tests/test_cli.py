@@ -0,0 +1,94 @@
+# CLI and Claude Desktop config tests
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from mcp_visualization.claude_config import ClaudeDesktopConfigManager
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Config manager writing to a temporary Claude Desktop config file"""
+    manager = ClaudeDesktopConfigManager()
+    manager.config_path = tmp_path / "claude_desktop_config.json"
+    return manager
+
+
+def test_cli_import_is_lazy():
+    """Importing the CLI does not pull in Rich, DuckDB or the subcommands"""
+    code = (
+        "import sys, mcp_visualization.cli; "
+        "print(sorted(m for m in ('rich', 'duckdb', 'mcp_visualization.cli_cmds.status') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_write_config_replaces_file_atomically(config_manager):
+    """The config is written through a temp file that does not linger"""
+    config_manager._write_config({"mcpServers": {"demo": {"command": "python", "args": []}}})
+
+    assert json.loads(config_manager.config_path.read_text())["mcpServers"] == {
+        "demo": {"command": "python", "args": []}
+    }
+    assert not config_manager.config_path.with_suffix(".json.tmp").exists()
+
+
+def test_list_mcp_servers_returns_copy(config_manager):
+    """Mutating the listed servers does not change the cached mapping"""
+    config_manager._write_config({"mcpServers": {"demo": {"command": "python", "args": []}}})
+
+    config_manager.list_mcp_servers().clear()
+
+    assert list(config_manager.list_mcp_servers()) == ["demo"]
+
+
+def test_remove_without_yes_refuses_piped_stdin(tmp_path):
+    """A piped remove exits with an error and keeps the server unless --yes is given"""
+    config_path = tmp_path / ".config" / "claude" / "claude_desktop_config.json"
+    config_path.parent.mkdir(parents=True)
+    config_path.write_text(json.dumps({"mcpServers": {"demo": {"command": "python", "args": []}}}))
+    command = [sys.executable, "-m", "mcp_visualization.cli_entry", "remove", "--server-name", "demo"]
+    env = {**os.environ, "HOME": str(tmp_path)}
+
+    refused = subprocess.run(command, input="\n", capture_output=True, text=True, env=env)
+    assert refused.returncode == 1
+    assert "demo" in json.loads(config_path.read_text())["mcpServers"]
+
+    confirmed = subprocess.run(command + ["--yes"], input="", capture_output=True, text=True, env=env)
+    assert confirmed.returncode == 0
+    assert json.loads(config_path.read_text())["mcpServers"] == {}
+
+
+def test_fast_path_help_matches_click():
+    """cli_entry's hand-written --help stays identical to click's rendering"""
+    from click.testing import CliRunner
+
+    from mcp_visualization.cli import main
+    from mcp_visualization.cli_entry import MAIN_HELP, PROG_NAME
+
+    # click renders help at min(terminal width, 80) - 2 columns on a real terminal
+    result = CliRunner().invoke(main, ["--help"], prog_name=PROG_NAME, terminal_width=78)
+
+    assert result.exit_code == 0
+    assert result.output.rstrip("\n") == MAIN_HELP
+
+
+def test_get_status_returns_copy(config_manager):
+    """Mutating a returned status does not change later results"""
+    config_manager._write_config({"mcpServers": {"demo": {"command": "python", "args": []}}})
+
+    first = config_manager.get_status()
+    first["servers"].append("injected")
+    first["config_valid"] = None
+
+    second = config_manager.get_status()
+    assert second["servers"] == ["demo"]
+    assert second["config_valid"] is not None
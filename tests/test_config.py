@@ -0,0 +1,79 @@
+# Configuration tests
+from pathlib import Path
+
+import pytest
+
+from mcp_visualization.config import settings as settings_module
+from mcp_visualization.config.settings import (
+    CONFIG_YAML_PATH,
+    Settings,
+    compile_template,
+)
+
+
+@pytest.fixture
+def yaml_file(monkeypatch, tmp_path):
+    """Point the YAML source at a temporary file and rebuild settings afterwards"""
+    path = tmp_path / "config.yaml"
+    monkeypatch.setitem(Settings.model_config, "yaml_file", path)
+    settings_module._build_settings.cache_clear()
+    yield path
+    settings_module._build_settings.cache_clear()
+
+
+def test_yaml_source_is_packaged_file():
+    """Settings read config.yaml from the package, not the working directory"""
+    assert CONFIG_YAML_PATH.parent == Path(settings_module.__file__).parent
+    assert Settings.model_config["yaml_file"] == CONFIG_YAML_PATH
+
+
+def test_working_directory_yaml_is_ignored(monkeypatch, tmp_path):
+    """A stray config.yaml in the working directory does not override settings"""
+    (tmp_path / "config.yaml").write_text(
+        "server:\n  log_level: DEBUG\ndatabase:\n  settings:\n    threads: 99\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    settings = Settings()
+
+    assert settings.database.settings.threads != 99
+
+
+def test_nested_yaml_values_are_loaded(yaml_file):
+    """Nested mappings in the YAML file reach the nested models"""
+    yaml_file.write_text("database:\n  settings:\n    pool_size: 7\n")
+
+    assert Settings().database.settings.pool_size == 7
+
+
+def test_malformed_yaml_falls_back_to_defaults(yaml_file):
+    """An invalid YAML file yields default settings instead of raising"""
+    yaml_file.write_text("server: oops\n")
+
+    settings = settings_module._build_settings()
+
+    assert isinstance(settings, Settings)
+    assert settings.database.settings.pool_size == 4
+
+
+def test_compile_template_renders_named_fields():
+    """Plain named fields render like str.format"""
+    template = "Chart {chart_type!r} for {table:>8} {{literal}}"
+    render = compile_template(template)
+
+    assert render(chart_type="bar", table="sales") == template.format(
+        chart_type="bar", table="sales"
+    )
+
+
+@pytest.mark.parametrize(
+    "template, kwargs",
+    [
+        ("{data.real}", {"data": 3 + 4j}),
+        ("{columns[0]}", {"columns": ["region"]}),
+        ("{value:{spec}}", {"value": 3.14159, "spec": ".2f"}),
+    ],
+)
+def test_compile_template_falls_back_to_str_format(template, kwargs):
+    """Lookups and nested specs keep full str.format behavior"""
+    assert compile_template(template)(**kwargs) == template.format(**kwargs)
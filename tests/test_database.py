@@ -1 +1,148 @@
 # Database tests
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# utils/validators.py imports `config.settings` absolutely, which only
+# resolves with the package directory on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_visualization"))
+
+from mcp_visualization.config.settings import FileAccessConfig
+from mcp_visualization.database.manager import DatabaseManager, TOP_VALUES_MAX_DISTINCT
+from mcp_visualization.database.queries import QueryBuilder
+
+
+@pytest.fixture
+def db_manager():
+    """In-memory manager with a small table of mixed cardinality"""
+    manager = DatabaseManager(":memory:")
+    manager.connection.execute(
+        f"""
+        CREATE TABLE items AS
+        SELECT range AS id, range % 3 AS bucket, 'c' || (range % 5) AS label
+        FROM range({TOP_VALUES_MAX_DISTINCT + 500})
+        """
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def csv_manager(db_manager, tmp_path):
+    """Manager allowed to load CSVs from tmp_path and to drop tables"""
+    db_manager.security_config = db_manager.security_config.model_copy(
+        update={
+            "allowed_sql_keywords": db_manager.security_config.allowed_sql_keywords
+            | {"DROP"},
+            "file_access": FileAccessConfig(allowed_paths=[tmp_path]),
+        }
+    )
+    return db_manager
+
+
+def test_pool_serves_concurrent_queries(db_manager):
+    """Concurrent queries get correct results and every cursor is returned"""
+    pool_size = db_manager.config.settings.pool_size
+
+    def run(n):
+        return db_manager.execute_query(f"SELECT {n} AS n, COUNT(*) AS c FROM items")
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(run, range(64)))
+
+    assert [int(df["n"].iloc[0]) for df in results] == list(range(64))
+    assert all(int(df["c"].iloc[0]) == TOP_VALUES_MAX_DISTINCT + 500 for df in results)
+    assert db_manager._pool.qsize() == pool_size
+
+
+def test_column_profile_query_is_single_scan():
+    """The stats query has no per-column subqueries"""
+    query = QueryBuilder().build_column_profile_query(
+        "items", [("id", True), ("label", False)]
+    )
+
+    assert query.count("FROM") == 1
+    assert "MEDIAN(\"id\")" in query
+    assert "MEDIAN(\"label\")" not in query
+
+
+def test_profile_columns_matches_per_column_stats(db_manager):
+    """Fused profiling returns the same counts as querying each column"""
+    profiles = db_manager._profile_columns("items", db_manager.get_columns("items"))
+
+    for column, distinct in (("id", TOP_VALUES_MAX_DISTINCT + 500), ("bucket", 3), ("label", 5)):
+        stats = profiles[column]
+        assert stats["total_count"] == TOP_VALUES_MAX_DISTINCT + 500
+        assert stats["null_count"] == 0
+        assert stats["distinct_count"] == distinct
+
+    assert profiles["bucket"]["max_value"] == 2
+    assert sorted(item["value"] for item in profiles["label"]["top_values"]) == [
+        "c0", "c1", "c2", "c3", "c4"
+    ]
+
+
+def test_profile_columns_skips_high_cardinality_top_values(db_manager):
+    """Only low-cardinality columns are grouped for top values"""
+    profiles = db_manager._profile_columns("items", db_manager.get_columns("items"))
+
+    assert profiles["id"]["top_values"] == []
+    assert len(profiles["bucket"]["top_values"]) == 3
+
+
+def test_column_stats_keeps_top_values_for_single_column(db_manager):
+    """get_column_stats still lists top values of a high-cardinality column"""
+    stats = db_manager.get_column_stats("items", "id")
+
+    assert len(stats["top_values"]) == 10
+    assert all(item["count"] == 1 for item in stats["top_values"])
+
+
+def test_columns_cache_follows_drop_and_reload(csv_manager, tmp_path):
+    """DESCRIBE results are dropped when the table is dropped and reloaded"""
+    first = tmp_path / "first.csv"
+    first.write_text("a,b\n1,2\n")
+    second = tmp_path / "second.csv"
+    second.write_text("x\n3\n")
+
+    assert csv_manager.load_csv(str(first), "loaded")["success"]
+    assert [c["name"] for c in csv_manager.get_columns("loaded")] == ["a", "b"]
+
+    assert csv_manager.drop_table("loaded")
+    assert csv_manager.get_columns("loaded") == []
+
+    assert csv_manager.load_csv(str(second), "loaded")["success"]
+    assert [c["name"] for c in csv_manager.get_columns("loaded")] == ["x"]
+
+
+def test_columns_cache_cleared_by_create_view(db_manager):
+    """Creating a view forgets cached DESCRIBE results"""
+    db_manager.get_columns("items")
+    assert "items" in db_manager._columns_cache
+
+    assert db_manager.create_view("labels", "SELECT label FROM items")
+    assert db_manager._columns_cache == {}
+    assert [c["name"] for c in db_manager.get_columns("labels")] == ["label"]
+
+
+def test_get_columns_returns_copies(db_manager):
+    """Mutating a returned column list does not change the cache"""
+    columns = db_manager.get_columns("items")
+    columns.clear()
+
+    assert len(db_manager.get_columns("items")) == 3
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda qb, table: qb.build_column_profile_query(table, [("id", True)]),
+        lambda qb, table: qb.build_top_values_query(table, ["id"]),
+    ],
+)
+def test_profile_builders_reject_unsafe_table_names(build):
+    """Table names go through _sanitize_table_name like the other builders"""
+    with pytest.raises(ValueError):
+        build(QueryBuilder(), "items; DROP TABLE items")